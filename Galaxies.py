@@ -20,18 +20,20 @@ Features:
 
 DAA ALGORITHMS IMPLEMENTED:
 ======================
-1. GRAPH: Adjacency list representation of cell connectivity
+1. GRAPH: Cell connectivity over a bitmap of drawn walls
    - Undirected, unweighted graph where cells are vertices
-   - Edges connect adjacent cells (horizontal/vertical neighbors)
-   - Used for region detection via BFS traversal
-   - TC: O(V+E), SC: O(V+E)
+   - Edges connect adjacent cells (horizontal/vertical neighbors) not separated by a wall
+   - Regions found by union-find (component_labels), TC: O(V·α(V)), SC: O(V)
+   - The region summary (labels, members, validity) is then carried across
+     each wall change incrementally: a split is found by a search confined
+     to one region, a merge joins two member lists, TC: O(C) per change
 
 2. GREEDY: Edge scoring and hint selection algorithm
    - Scores each edge candidate by its potential to separate valid regions
    - Metrics: region separation power, dot enclosure improvement
    - Selects edge with maximum score (greedy choice)
-   - TC: O(E * R * D) where E=edges, R=region size, D=dots
-   - SC: O(E)
+   - Lazy max-heap: only candidates in a region a move changed are re-scored
+   - TC: O(C) per candidate scored where C=region size, SC: O(E)
 
 3. SORTING: Multiple sorting techniques for optimization
    - Sort edges by score (descending) for heuristic candidate selection
@@ -50,9 +52,11 @@ Run:
 
 import tkinter as tk
 from tkinter import messagebox
-from collections import deque, defaultdict
-from dataclasses import dataclass
+from collections import defaultdict
+from functools import lru_cache
+from typing import NamedTuple
 
+import heapq
 import random
 
 
@@ -60,43 +64,141 @@ import random
 # SECTION 1: GRAPH ALGORITHMS & DATA STRUCTURES
 # ==============================================================================
 
-def bfs_components(adj, total_nodes):
+def edge_index(edge, n):
     """
-    GRAPH TRAVERSAL (BFS):
-    Find all connected components in an undirected graph.
-    
-    TC: O(V+E), SC: O(V)
-    
+    Pack an edge ('h'|'v', x, y) into an integer index in [0, 2*(n+1)²).
+    Horizontal edges occupy the first (n+1)² slots, vertical edges the rest.
+    """
+    t, x, y = edge
+    return (0 if t == 'h' else (n + 1) * (n + 1)) + y * (n + 1) + x
+
+
+def edge_bitmap(edges, n):
+    """Build a bytearray bitmap (1 = blocked) over edge_index() for a set of edges."""
+    blocked = bytearray(2 * (n + 1) * (n + 1))
+    for e in edges:
+        blocked[edge_index(e, n)] = 1
+    return blocked
+
+
+def edge_bits(edges, n):
+    """Pack a set of edges into an int with bit edge_index(e) set for each edge."""
+    bits = 0
+    for e in edges:
+        bits |= 1 << edge_index(e, n)
+    return bits
+
+
+@lru_cache(maxsize=None)
+def index_edges(n):
+    """Inverse of edge_index(): tuple mapping each index back to its ('h'|'v', x, y) edge."""
+    stride = n + 1
+    return tuple(('h' if i < stride * stride else 'v', i % stride, (i // stride) % stride)
+                 for i in range(2 * stride * stride))
+
+
+@lru_cache(maxsize=None)
+def internal_edges(n):
+    """
+    Precompute every interior wall of the N x N grid as
+    (edge_index, cell_a, cell_b), in row-major order (right wall, then bottom wall).
+    Lets graph builders run a single flat pass instead of re-deriving
+    indices per cell.  Built once per grid size and shared (read-only tuple).
+
+    TC: O(N²), SC: O(N²)
+    """
+    stride = n + 1
+    v_base = stride * stride
+    pairs = []
+    for y in range(n):
+        for x in range(n):
+            u = y * n + x
+            if x + 1 < n:
+                pairs.append((v_base + y * stride + x + 1, u, u + 1))
+            if y + 1 < n:
+                pairs.append(((y + 1) * stride + x, u, u + n))
+    return tuple(pairs)
+
+
+@lru_cache(maxsize=None)
+def cell_neighbours(n):
+    """cell_id -> ((neighbour cell_id, edge_index of the wall between them), ...), once per grid size."""
+    nbrs = [[] for _ in range(n * n)]
+    for w, u, v in internal_edges(n):
+        nbrs[u].append((v, w))
+        nbrs[v].append((u, w))
+    return tuple(tuple(cell) for cell in nbrs)
+
+
+def component_labels(blocked, n, pairs=None):
+    """
+    GRAPH CONNECTIVITY (UNION-FIND):
+    Label every cell of the N x N grid with the root of its connected
+    component, directly from the bitmap of drawn edges and without
+    materializing an adjacency list.
+
+    Two neighbouring cells are unioned iff the wall between them is not set
+    in `blocked`.  Uses path halving + union by rank, with find() inlined
+    into the union step to keep the hot loop free of nested calls.
+
+    TC: O(N² · α(N²)), SC: O(N²)
+
     Args:
-      adj: adjacency list {node -> [neighbors]}
-      total_nodes: total number of nodes (0 to total_nodes-1)
-    
+      blocked: bytearray edge bitmap indexed by edge_index()
+      n: grid size
+      pairs: internal_edges(n), if the caller already has it
+
     Returns:
-      list: [component, ...] where each component is a list of node IDs
+      list: labels[cell_id] = root cell ID of that cell's component
     """
-    seen = set()
-    comps = []
-    for s in range(total_nodes):
-        if s in seen:
-            continue
-        q = deque([s])
-        seen.add(s)
-        comp = []
-        while q:
-            u = q.popleft()
-            comp.append(u)
-            for v in adj.get(u, []):
-                if v not in seen:
-                    seen.add(v)
-                    q.append(v)
-        comps.append(comp)
-    return comps
+    parent = list(range(n * n))
+    rank = bytearray(n * n)
+
+    def union(a, b):
+        while parent[a] != a:
+            parent[a] = a = parent[parent[a]]
+        while parent[b] != b:
+            parent[b] = b = parent[parent[b]]
+        if a == b:
+            return
+        if rank[a] < rank[b]:
+            a, b = b, a
+        parent[b] = a
+        if rank[a] == rank[b]:
+            rank[a] += 1
+
+    if pairs is None:
+        pairs = internal_edges(n)
+    for w, a, b in pairs:
+        if not blocked[w]:
+            union(a, b)
+
+    for u in range(n * n):
+        r = u
+        while parent[r] != r:
+            r = parent[r]
+        parent[u] = r
+    return parent
+
+
+def edge_cells(edge, n):
+    """Return the two cell IDs separated by an interior edge ('h'|'v', x, y)."""
+    t, x, y = edge
+    if t == 'v':
+        return y * n + x - 1, y * n + x
+    return (y - 1) * n + x, y * n + x
 
 
 # ==============================================================================
 # SECTION 2: PUZZLE GENERATOR
 # ==============================================================================
 
+# Rectangle split flags used by GalaxiesPuzzle.generate()
+SPLIT_V = 1       # width >= 2: can be cut by a vertical line
+SPLIT_H = 2       # height >= 2: can be cut by a horizontal line
+PREFER_V = 4      # width >= height: bias towards a vertical cut
+SPLIT_ANY = SPLIT_V | SPLIT_H
+
 class GalaxiesPuzzle:
     """
     Puzzle:
@@ -128,30 +230,37 @@ class GalaxiesPuzzle:
             # for 7x7, this gives a nice density
             target_rects = self.rng.randint(9, 14)
 
+        # Per-rectangle split flags, computed once when the rectangle is created
+        # (a 1-wide side can't be split: prevents too many tiny pieces)
+        def split_flags(w, h):
+            return ((SPLIT_V if w >= 2 else 0) | (SPLIT_H if h >= 2 else 0) |
+                    (PREFER_V if w >= h else 0))
+
         rects = [(0, 0, n, n)]
+        flags = [split_flags(n, n)]
 
-        # prevent too many tiny pieces
-        def can_split(r):
-            _, _, w, h = r
-            return (w >= 2) or (h >= 2)
+        # indices into rects of rectangles that can still be split; a chosen
+        # rectangle is swap-popped from here and replaced in place in rects
+        splittable = [0] if flags[0] & SPLIT_ANY else []
 
         tries = 0
         while len(rects) < target_rects and tries < 5000:
             tries += 1
-            candidates = [r for r in rects if can_split(r)]
-            if not candidates:
+            if not splittable:
                 break
-            r = self.rng.choice(candidates)
-            rects.remove(r)
-            x, y, w, h = r
+            j = self.rng.randrange(len(splittable))
+            i = splittable[j]
+            splittable[j] = splittable[-1]
+            splittable.pop()
+            x, y, w, h = rects[i]
+            f = flags[i]
 
             # choose split direction biased to longer dimension
-            if w >= 2 and h >= 2:
-                vertical = (w >= h and self.rng.random() < 0.65) or (self.rng.random() < 0.35)
-            elif w >= 2:
-                vertical = True
+            if f & SPLIT_ANY == SPLIT_ANY:
+                # P(vertical) = 0.65 + 0.35*0.35 if wider, else 0.35, in one draw
+                vertical = self.rng.random() < (0.65 + 0.35 * 0.35 if f & PREFER_V else 0.35)
             else:
-                vertical = False
+                vertical = bool(f & SPLIT_V)
 
             if vertical:
                 # split at k between 1..w-1
@@ -163,17 +272,24 @@ class GalaxiesPuzzle:
                 r1 = (x, y, w, k)
                 r2 = (x, y + k, w, h - k)
 
-            rects.append(r1)
+            rects[i] = r1
             rects.append(r2)
+            flags[i] = split_flags(r1[2], r1[3])
+            flags.append(split_flags(r2[2], r2[3]))
+            if flags[i] & SPLIT_ANY:
+                splittable.append(i)
+            if flags[-1] & SPLIT_ANY:
+                splittable.append(len(rects) - 1)
 
         self.rects = rects
 
-        # Build owner grid
+        # Build owner grid: one slice assignment per rectangle row
         self.owner = [-1] * (n * n)
         for idx, (x, y, w, h) in enumerate(self.rects):
+            span = [idx] * w
             for yy in range(y, y + h):
-                for xx in range(x, x + w):
-                    self.owner[self.cell_id(xx, yy)] = idx
+                start = yy * n + x
+                self.owner[start:start + w] = span
 
         # Dots at rectangle centers
         self.dots = []
@@ -196,18 +312,17 @@ class GalaxiesPuzzle:
             edges.add(('v', 0, y))
             edges.add(('v', n, y))
 
-        # internal borders between different rectangles
+        # internal borders between different rectangles: compare each owner row
+        # with itself shifted by one (vertical walls) and with the next row
+        # (horizontal walls)
+        owner = self.owner
+        row = owner[0:n]
         for y in range(n):
-            for x in range(n):
-                o = self.owner[self.cell_id(x, y)]
-                if x + 1 < n:
-                    o2 = self.owner[self.cell_id(x + 1, y)]
-                    if o2 != o:
-                        edges.add(('v', x + 1, y))
-                if y + 1 < n:
-                    o2 = self.owner[self.cell_id(x, y + 1)]
-                    if o2 != o:
-                        edges.add(('h', x, y + 1))
+            edges.update(('v', x + 1, y) for x, (o, o2) in enumerate(zip(row, row[1:])) if o != o2)
+            if y + 1 < n:
+                below = owner[(y + 1) * n:(y + 2) * n]
+                edges.update(('h', x, y + 1) for x, (o, o2) in enumerate(zip(row, below)) if o != o2)
+                row = below
         return edges
 
 
@@ -220,34 +335,39 @@ def has_rotational_symmetry(region_cells, dot_x, dot_y, n):
     Check if a region has 180° rotational symmetry about the dot center (dot_x, dot_y).
     A cell (x, y) maps to (2*dot_x - x - 1, 2*dot_y - y - 1) under 180° rotation about the dot.
     """
+    # Dots sit on half-integer coordinates, so the mirror offsets are exact ints
+    sx0 = int(2 * dot_x) - 1
+    sy0 = int(2 * dot_y) - 1
     for x, y in region_cells:
-        # Rotate (x, y) 180° about (dot_x, dot_y)
-        sym_x = 2 * dot_x - x - 1
-        sym_y = 2 * dot_y - y - 1
-        # Check if rotated cell is in the region
-        if (int(sym_x), int(sym_y)) not in region_cells:
+        # Rotate (x, y) 180° about (dot_x, dot_y) and check it is in the region
+        if (sx0 - x, sy0 - y) not in region_cells:
             return False
     return True
 
 
 def count_dots_in_region(region_cells, dots):
-    # TC: O(R*D), SC: O(1)
-    count = 0
-    for dot_x, dot_y in dots:
-        for x, y in region_cells:
-            if x <= dot_x < x + 1 and y <= dot_y < y + 1:
-                count += 1
-                break
-    return count
+    # A dot lies in exactly one cell: (floor(dot_x), floor(dot_y))
+    # TC: O(D), SC: O(1)
+    if not isinstance(region_cells, (set, frozenset)):
+        region_cells = set(region_cells)
+    return sum(1 for dot_x, dot_y in dots if (int(dot_x), int(dot_y)) in region_cells)
 
 
 def is_region_valid(region_cells, dot_x, dot_y, dots, n):
-    # TC: O(R*D + R), SC: O(1)
+    # TC: O(R + D), SC: O(R)
     dot_count = count_dots_in_region(region_cells, dots)
     if dot_count != 1:
         return False
 
-    if not (int(dot_x) in [x for x, y in region_cells] and int(dot_y) in [y for x, y in region_cells]):
+    xs = [x for x, y in region_cells]
+    ys = [y for x, y in region_cells]
+
+    # Cheap reject before the full symmetry pass: a region with 180° symmetry
+    # about the dot has its bounding box centred on the dot.
+    if min(xs) + max(xs) + 1 != 2 * dot_x or min(ys) + max(ys) + 1 != 2 * dot_y:
+        return False
+
+    if not (int(dot_x) in xs and int(dot_y) in ys):
         return False
 
     if not has_rotational_symmetry(region_cells, dot_x, dot_y, n):
@@ -260,15 +380,15 @@ def is_region_valid(region_cells, dot_x, dot_y, dots, n):
 # SECTION 4: GAME STATE & DATA STRUCTURES
 # ==============================================================================
 
-@dataclass
-class Move:
+# NamedTuples rather than dataclasses: no per-instance __dict__, so long
+# undo/redo histories stay compact.  Both are immutable; replace, don't mutate.
+class Move(NamedTuple):
     edge: tuple
     added: bool
-    who: int
+    who: str
 
 
-@dataclass
-class Arrow:
+class Arrow(NamedTuple):
     cell_x: int
     cell_y: int
     dot_idx: int
@@ -278,6 +398,10 @@ class Arrow:
 # SECTION 5: GREEDY ALGORITHM & HEURISTICS
 # ==============================================================================
 
+# Upper bound of GalaxiesGame.greedy_score (separation + validity bonus)
+MAX_GREEDY_SCORE = 15
+
+
 class GalaxiesGame:
     """
     Core game logic with GREEDY hint generation.
@@ -286,40 +410,149 @@ class GalaxiesGame:
     def __init__(self, n = 7, seed = None):
         self.N = n
         self.rng = random.Random(seed)
+        # (edge_index, cell_a, cell_b) for every interior wall; fixed for this N
+        self._internal_edges = internal_edges(n)
+        # cell_id -> ((neighbour cell_id, edge_index of the wall between them), ...)
+        self._cell_nbrs = cell_neighbours(n)
+        # Bumped on every edge change; keys the cached get_valid_regions() result
+        self.rev = 0
+        self._valid_cache = None
         self.new_puzzle()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def border_edges(n):
-        edges = set()
-        for x in range(n):
-            edges.add(('h', x, 0))
-            edges.add(('h', x, n))
-        for y in range(n):
-            edges.add(('v', 0, y))
-            edges.add(('v', n, y))
-        return edges
+        """Outer border of an N x N grid; built once per N and shared (read-only)."""
+        return frozenset([('h', x, y) for y in (0, n) for x in range(n)] +
+                         [('v', x, y) for x in (0, n) for y in range(n)])
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def border_bitmap(n):
+        """edge_bitmap() of border_edges(n), cached as immutable bytes."""
+        return bytes(edge_bitmap(GalaxiesGame.border_edges(n), n))
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def border_bits(n):
+        """edge_bits() of border_edges(n)."""
+        return edge_bits(GalaxiesGame.border_edges(n), n)
 
     def new_puzzle(self):
         self.puzzle = GalaxiesPuzzle(n=self.N, rng=self.rng)
         self.puzzle.generate()
         self.fixed = self.border_edges(self.N)
-        self.solution = set(self.puzzle.solution_edges) - set(self.fixed)
+        self.solution = self.puzzle.solution_edges - self.fixed
+        # edge_bits() of the full solution board (border + solution), for solve()
+        self.solved_bits = self.border_bits(self.N) | edge_bits(self.solution, self.N)
+        # cell_id -> index of the dot inside that cell (-1 if none).  A dot lies in
+        # exactly one cell, (floor(dx), floor(dy)), and no two rectangles share it.
+        self.cell_to_dot = [-1] * (self.N * self.N)
+        # Per dot: the 180° rotation about it maps (x, y) to (sx - x, sy - y), i.e.
+        # cell id c to sym - c while inside a bounding box centred on the dot
+        self.dot_mirror = []
+        for dot_idx, (dx, dy) in enumerate(self.puzzle.dots):
+            self.cell_to_dot[int(dy) * self.N + int(dx)] = dot_idx
+            sx, sy = int(2 * dx) - 1, int(2 * dy) - 1
+            self.dot_mirror.append((sx, sy, sy * self.N + sx))
         self.reset()
 
     def reset(self):
         self.edges = set(self.fixed)
+        # Bitmap mirror of self.edges (indexed by edge_index) for the graph hot loops
+        self.blocked = bytearray(self.border_bitmap(self.N))
+        # Same set packed into an int (bit edge_index(e)), for cheap whole-board diffs
+        self.edge_bits = self.border_bits(self.N)
         self.history = []
         self.redo_stack = []
-        self.arrows = []
+        self.arrows_by_cell = {}  # (cell_x, cell_y) -> Arrow, in placement order
+        self._clear_hints()
+        # Incremental solved-state: solution edges not drawn / non-solution edges drawn
+        self._missing_count = len(self.solution)
+        self._wrong_count = 0
+        self.rev += 1
+
+    @property
+    def arrows(self):
+        """Placed arrows as a list (read-only view of arrows_by_cell)."""
+        return list(self.arrows_by_cell.values())
+
+    def _set_edge(self, edge, present):
+        """Add or remove an edge, keeping self.edges, self.blocked, self.edge_bits,
+        the solved-state counters and the region summary in sync; bumps rev."""
+        if (edge in self.edges) == present:
+            return
+        a, b = edge_cells(edge, self.N)
+        # A wall along an existing region boundary changes no region, so no hint score
+        along_boundary = False
+        if present and self._valid_cache is not None and self._valid_cache[0] == self.rev:
+            labels = self._valid_cache[1][2]
+            along_boundary = labels[a] != labels[b]
+        if present:
+            self.edges.add(edge)
+        else:
+            self.edges.discard(edge)
+        idx = edge_index(edge, self.N)
+        self.blocked[idx] = 1 if present else 0
+        self.edge_bits ^= 1 << idx
+        delta = -1 if present else 1
+        if edge in self.solution:
+            self._missing_count += delta
+        else:
+            self._wrong_count -= delta
+        summary = self._update_summary(edge, idx, present)
+        self.rev += 1
+        if summary is not None:
+            self._valid_cache = (self.rev, summary)
+        if self._score_live and not along_boundary:
+            self._requeue_region_hints(a, b)
+
+    def _clear_hints(self):
+        """Empty the lazy-greedy hint heap (see computer_move)."""
+        # Heap of (-score, seq, edge); _score_live maps each candidate to the
+        # (seq, exact) of its current entry, older entries for it are stale.
+        # exact=False entries carry MAX_GREEDY_SCORE and must be re-scored.
+        self._score_heap = []
+        self._score_live = {}
+        self._score_seq = 0
+
+    def _push_hint(self, edge, score, exact):
+        """Push `edge` onto the hint heap, superseding its older entry."""
+        seq = self._score_seq
+        self._score_seq += 1
+        self._score_live[edge] = (seq, exact)
+        heap = self._score_heap
+        if len(heap) > 2 * len(self._score_live) + 16:
+            # Mostly superseded entries: keep only the live ones
+            heap[:] = [entry for entry in heap if self._score_live.get(entry[2], (None,))[0] == entry[1]]
+            heapq.heapify(heap)
+        heapq.heappush(heap, (-score, seq, edge))
+
+    def _requeue_region_hints(self, a, b):
+        """
+        A hint score depends only on the region holding the edge, so after a
+        wall change only candidates touching the region(s) of cells a and b
+        (the merged region, or both halves of a split) need re-scoring.
+        """
+        _, _, labels, members, _ = self._region_summary()
+        n = self.N
+        live = self._score_live
+        for root in {labels[a], labels[b]}:
+            for cell_id in members[root]:
+                y, x = divmod(cell_id, n)
+                for e in (('h', x, y), ('h', x, y + 1), ('v', x, y), ('v', x + 1, y)):
+                    entry = live.get(e)
+                    if entry is not None and entry[1]:
+                        self._push_hint(e, MAX_GREEDY_SCORE, exact=False)
 
     def toggle_edge(self, edge, who):
         if edge in self.fixed:
             return False
         if edge in self.edges:
-            self.edges.remove(edge)
+            self._set_edge(edge, False)
             self.history.append(Move(edge=edge, added=False, who=who))
         else:
-            self.edges.add(edge)
+            self._set_edge(edge, True)
             self.history.append(Move(edge=edge, added=True, who=who))
         self.redo_stack.clear()
         return True
@@ -328,10 +561,7 @@ class GalaxiesGame:
         if not self.history:
             return False
         mv = self.history.pop()
-        if mv.added:
-            self.edges.discard(mv.edge)
-        else:
-            self.edges.add(mv.edge)
+        self._set_edge(mv.edge, not mv.added)
         self.redo_stack.append(mv)
         return True
 
@@ -339,128 +569,301 @@ class GalaxiesGame:
         if not self.redo_stack:
             return False
         mv = self.redo_stack.pop()
-        if mv.added:
-            self.edges.add(mv.edge)
-        else:
-            self.edges.discard(mv.edge)
+        self._set_edge(mv.edge, mv.added)
         self.history.append(mv)
         return True
 
+    def solve(self):
+        """Replace the drawn edges with the full solution (border + solution edges)."""
+        self.edges = self.solution | self.fixed  # set | frozenset -> mutable set
+        self.blocked = edge_bitmap(self.edges, self.N)
+        self.edge_bits = self.solved_bits
+        self._missing_count = 0
+        self._wrong_count = 0
+        self._clear_hints()
+        self.rev += 1
+
     def is_solved(self):
-        return (self.edges - self.fixed) == self.solution
+        # O(1): counters are maintained by _set_edge/reset/solve
+        return self._missing_count == 0 and self._wrong_count == 0
+
+    @property
+    def user_edge_count(self):
+        """Number of non-fixed edges drawn, i.e. len(edges - fixed), from the solved-state counters."""
+        return len(self.solution) - self._missing_count + self._wrong_count
 
     # Cell adjacency graph given current walls
     def cell_adj_graph(self, extra_block=None):
         # GRAPH: Build adjacency list
         # TC: O(n^2), SC: O(n^2)
         adj = defaultdict(list)
-        n = self.N
-        blocked = set(self.edges)
-        if extra_block is not None:
-            blocked.add(extra_block)
-
-        def cid(x, y):
-            return y * n + x
-
-        for y in range(n):
-            for x in range(n):
-                u = cid(x, y)
-                if x + 1 < n:
-                    w = ('v', x + 1, y)
-                    if w not in blocked:
-                        v = cid(x + 1, y)
-                        adj[u].append(v); adj[v].append(u)
-                if y + 1 < n:
-                    w = ('h', x, y + 1)
-                    if w not in blocked:
-                        v = cid(x, y + 1)
-                        adj[u].append(v); adj[v].append(u)
+        blocked = self.blocked
+        extra = edge_index(extra_block, self.N) if extra_block is not None else -1
+        for w, u, v in self._internal_edges:
+            if not blocked[w] and w != extra:
+                adj[u].append(v); adj[v].append(u)
         return adj
 
     def get_valid_regions(self):
-        """Returns set of cell_ids that belong to valid regions."""
-        n = self.N
-        adj = self.cell_adj_graph()
-        comps = bfs_components(adj, n * n)
+        """
+        Returns set of cell_ids that belong to valid regions.
+
+        The result is cached against `self.rev`, so repeated calls between
+        edge changes are O(1).  Callers must treat the returned set as read-only.
+        """
+        return self._region_summary()[0]
+
+    def region_count(self):
+        """Number of connected regions on the board; shares get_valid_regions()' pass and cache."""
+        return self._region_summary()[1]
+
+    def _region_summary(self):
+        """
+        Region statistics of the current board from a single union-find pass,
+        cached per rev: (valid_cells, component count, labels, members, valid)
+        where labels[cell] is the cell's component root, members[root] lists
+        the component's cells and valid[root] says whether it is a valid region.
+        """
+        if self._valid_cache is not None and self._valid_cache[0] == self.rev:
+            return self._valid_cache[1]
+
+        labels = component_labels(self.blocked, self.N, pairs=self._internal_edges)
+        members = {}
+        for u, root in enumerate(labels):
+            members.setdefault(root, []).append(u)
+
         valid_cells = set()
+        valid = {}
+        for root, comp in members.items():
+            valid[root] = self.is_component_valid(comp)
+            if valid[root]:
+                valid_cells.update(comp)
 
-        for comp in comps:
-            # Get the cells in this component
-            region_cells = {(cid % n, cid // n) for cid in comp}
-            
-            # Find which dot(s) are in this region
-            dots_in_region = []
-            for dot_idx, (dx, dy) in enumerate(self.puzzle.dots):
-                for x, y in region_cells:
-                    if x <= dx < x + 1 and y <= dy < y + 1:
-                        dots_in_region.append((dot_idx, dx, dy))
-                        break
-            
-            # Must have exactly one dot
-            if len(dots_in_region) == 1:
-                dot_idx, dot_x, dot_y = dots_in_region[0]
-                # Check if region is valid (symmetry + center check)
-                if is_region_valid(region_cells, dot_x, dot_y, self.puzzle.dots, n):
-                    valid_cells.update(comp)
-
-        return valid_cells
+        summary = (valid_cells, len(members), labels, members, valid)
+        self._valid_cache = (self.rev, summary)
+        return summary
 
-    def computer_move(self):
+    def _update_summary(self, edge, w, present):
         """
-        GREEDY ALGORITHM:
-        For each missing edge, greedily compute a score based on:
-        1. Does it separate cells into more regions? (graph connectivity via BFS)
-        2. Does it help create valid regions? (constraint satisfaction)
-        
-        Greedy choice: Pick the edge with the highest score.
-        Uses: BFS for connected components (GRAPH traversal)
-        
-        TC: O(E * (V+E)) where E=edges, V=cells
-        SC: O(V+E)
+        Carry the cached region summary across one wall change (already applied
+        to self.blocked) instead of rebuilding it: a new wall inside a region may
+        split it in two, a removed wall between two regions merges them, and only
+        those regions are re-validated.  Returns None if no summary is cached for
+        the current rev.
+
+        TC: O(C) for the affected components of size ≤ C, plus O(V) list copies
         """
-        missing = list(self.solution - (self.edges - self.fixed))
-        if not missing:
+        if self._valid_cache is None or self._valid_cache[0] != self.rev:
             return None
+        summary = self._valid_cache[1]
+        valid_cells, count, labels, members, valid = summary
+        a, b = edge_cells(edge, self.N)
+        root, other = labels[a], labels[b]
+
+        if present:
+            if root != other:
+                return summary  # wall along an existing boundary
+            side = self._side_of_cut(a, b, w)
+            if side is None:
+                return summary  # region stays connected around the wall
+            comp = members[root]
+            keep = [u for u in comp if (u in side) == (root in side)]
+            moved = [u for u in comp if (u in side) != (root in side)]
+            dropped = (root,)
+            roots = (root, moved[0])
+            count += 1
+        else:
+            if root == other:
+                return summary  # wall inside a region: nothing joins
+            if len(members[root]) < len(members[other]):
+                root, other = other, root
+            keep = members[root] + members[other]
+            moved = members[other]
+            dropped = (root, other)
+            roots = (root,)
+            count -= 1
+
+        labels = labels[:]
+        for u in moved:
+            labels[u] = moved[0] if present else root
+        members = dict(members)
+        valid = dict(valid)
+        valid_cells = set(valid_cells)
+        for r in dropped:
+            if valid.pop(r):
+                valid_cells.difference_update(members[r])
+            del members[r]
+        members[root] = keep
+        if present:
+            members[moved[0]] = moved
+        for r in roots:
+            valid[r] = self.is_component_valid(members[r])
+            if valid[r]:
+                valid_cells.update(members[r])
+        return (valid_cells, count, labels, members, valid)
+
+    def _side_of_cut(self, a, b, cut):
+        """
+        Cells reachable from `a` without crossing drawn walls or the wall `cut`
+        (an edge index), searching only a's component.  Returns None as soon as
+        `b` is reached, i.e. when blocking `cut` would not split the component.
+        """
+        blocked = self.blocked
+        nbrs = self._cell_nbrs
+        seen = {a}
+        stack = [a]
+        while stack:
+            u = stack.pop()
+            for v, w in nbrs[u]:
+                if v not in seen and not blocked[w] and w != cut:
+                    if v == b:
+                        return None
+                    seen.add(v)
+                    stack.append(v)
+        return seen
 
+    def is_component_valid(self, comp):
+        """Check one connected component (list of cell_ids) against the region rules."""
         n = self.N
+        cell_to_dot = self.cell_to_dot
+        # One pass: count the dots, take the bounding box and build the cell bitmask
+        dot_idx = -1
+        dot_count = 0
+        min_x = min_y = n
+        max_x = max_y = -1
+        mask = 0
+        for cid in comp:
+            if cell_to_dot[cid] >= 0:
+                dot_idx = cell_to_dot[cid]
+                dot_count += 1
+            mask |= 1 << cid
+            y, x = divmod(cid, n)
+            if x < min_x:
+                min_x = x
+            if x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            if y > max_y:
+                max_y = y
+
+        # Must have exactly one dot
+        if dot_count != 1:
+            return False
 
-        def greedy_score(edge):
-            """
-            GREEDY SCORING FUNCTION:
-            Higher score = better edge to add.
-            Combines multiple heuristics.
-            """
-            score = 0
+        # Bounding box must be centred on the dot (same cheap reject as is_region_valid);
+        # the dot's own cell is in comp, so the int(dot) row/column checks hold already
+        sx, sy, sym = self.dot_mirror[dot_idx]
+        if min_x + max_x != sx or min_y + max_y != sy:
+            return False
 
-            # Score 1: Does adding this edge create more regions? (using BFS for GRAPH components)
-            adj_with_edge = self.cell_adj_graph(extra_block=edge)
-            comps_with = bfs_components(adj_with_edge, n * n)
+        # Inside that box the rotation never wraps a row, so the region is symmetric
+        # iff its lowest and highest ids pair up and the bitmask reads as a palindrome
+        lo = (mask & -mask).bit_length() - 1
+        if lo + mask.bit_length() - 1 != sym:
+            return False
+        bits = bin(mask).rstrip('0')
+        return bits[2:] == bits[:1:-1]
 
-            adj_without = self.cell_adj_graph()
-            comps_without = bfs_components(adj_without, n * n)
+    def greedy_score(self, edge):
+        """
+        GREEDY SCORING FUNCTION:
+        Higher score = better edge to add.
+        Combines multiple heuristics.
+
+        The component labels and per-component validity of the current board
+        are computed once per rev (_region_summary).  An undrawn candidate
+        edge lies inside one component; blocking it either leaves that
+        component whole or splits it in two, which a search confined to the
+        component decides (stopping early once the far cell is reached).
+        Only the two halves then need their validity checked.
+
+        TC: O(C) for a component of size C (plus O(V·α(V)) once per rev), SC: O(C)
+        """
+        n = self.N
+        _, _, labels, members, valid = self._region_summary()
 
-            if len(comps_with) > len(comps_without):
-                score += 10  # Good: creates separation
+        score = 0
+        a, b = edge_cells(edge, n)
+        w = edge_index(edge, n)
+        root = labels[a]
 
-            # Score 2: Does it help move toward valid regions?
-            valid_before = len(self.get_valid_regions())
-            self.edges.add(edge)
-            valid_after = len(self.get_valid_regions())
-            self.edges.discard(edge)
+        # Score 1: Does adding this edge create more regions? (GRAPH components)
+        # (a drawn edge, or one between different regions, cannot split anything)
+        side = None
+        if labels[b] == root and not self.blocked[w]:
+            side = self._side_of_cut(a, b, w)
+        if side is not None:
+            score += 10  # Good: creates separation
 
+            # Score 2: Does it help move toward valid regions?
+            # Only the component split by `edge` can change validity, so compare
+            # the valid cells of that component before and after the split.
+            comp = members[root]
+            comp_a = list(side)
+            comp_b = [u for u in comp if u not in side]
+            valid_before = len(comp) if valid[root] else 0
+            valid_after = ((len(comp_a) if self.is_component_valid(comp_a) else 0) +
+                           (len(comp_b) if self.is_component_valid(comp_b) else 0))
             if valid_after > valid_before:
                 score += 5  # Good: increases valid regions
 
-            return score
+        return score
 
-        # GREEDY: Score each edge and pick the maximum
-        scores = [(greedy_score(e), e) for e in missing]
-        scores.sort(key=lambda p: p[0], reverse=True)
+    def computer_move(self):
+        """
+        GREEDY ALGORITHM:
+        For each missing edge, greedily compute a score based on:
+        1. Does it separate cells into more regions? (graph connectivity via union-find)
+        2. Does it help create valid regions? (constraint satisfaction)
+        
+        Greedy choice: Pick the edge with the highest score.
+        Uses: union-find for connected components (GRAPH connectivity)
 
-        if scores:
-            best_edge = scores[0][1]
-            self.toggle_edge(best_edge, who="computer")
-            return best_edge
+        LAZY GREEDY (CELF-style):
+        Candidates live in a max-heap of (-score, seq, edge).  A score stays
+        exact until a wall change touches the candidate's region, which
+        _set_edge answers by re-queueing the region's candidates at
+        MAX_GREEDY_SCORE as needing a re-score.  The top entry is re-scored
+        until an exact one surfaces: nothing below it can score higher, so it
+        is a highest-scoring edge while only a few edges are scored per move.
+
+        TC: O(k * C + E log E) where k=edges re-scored, C=region size
+        SC: O(V+E)
+        """
+        missing = self.solution - (self.edges - self.fixed)
+        if not missing:
+            return None
+
+        heap = self._score_heap
+        live = self._score_live
+        new_edges = [e for e in missing if e not in live]
+        if new_edges:
+            # Seed in O(E) with heapify rather than one O(log E) push per edge
+            for e in new_edges:
+                live[e] = (self._score_seq, False)
+                heap.append((-MAX_GREEDY_SCORE, self._score_seq, e))
+                self._score_seq += 1
+            heapq.heapify(heap)
+
+        while heap:
+            _, seq, e = heap[0]
+            entry = live.get(e)
+            if entry is None or entry[0] != seq:
+                heapq.heappop(heap)  # superseded by a newer entry
+                continue
+            if e not in missing:
+                heapq.heappop(heap)
+                del live[e]
+                continue
+            if entry[1]:
+                # Exact score on top: greedy choice
+                heapq.heappop(heap)
+                del live[e]
+                self.toggle_edge(e, who="computer")
+                return e
+            heapq.heappop(heap)
+            self._push_hint(e, self.greedy_score(e), exact=True)
 
         return None
 
@@ -541,6 +944,10 @@ class SortingHelper:
 # SECTION 7: TKINTER UI
 # ==============================================================================
 
+# Per-difficulty layout: grid size -> (cell size px, dot radius px)
+SIZE_CONFIG = {7: (60, 9), 10: (50, 9), 15: (40, 7)}
+
+
 class GalaxiesUI(tk.Tk):
     """
     UI CLASS (Tkinter):
@@ -561,6 +968,7 @@ class GalaxiesUI(tk.Tk):
         # Default to 7x7, will be changed by menu if needed
         self.grid_size = 7
         self.menu_result = None
+        self._diff_window = None  # difficulty dialog, built on first use and reused
 
         # Show difficulty selection menu after window is created
         self.after(100, self.init_game_with_difficulty)
@@ -574,17 +982,15 @@ class GalaxiesUI(tk.Tk):
             return
 
         self.grid_size = self.menu_result
-        self.game = GalaxiesGame(n=self.grid_size)
 
-        self.cell = 40 if self.grid_size >= 15 else (50 if self.grid_size >= 10 else 60)
+        self.cell, self.dot_r = SIZE_CONFIG[self.grid_size]
         self.margin = 30
         self.wall_w = 5
         self.grid_w = 1
-        self.dot_r = 7 if self.grid_size >= 15 else 9
         self.snap_tol = 0.18
         self.arrow_len = 12
 
-        n = self.game.N
+        n = self.grid_size
         w = self.margin * 2 + self.cell * n
         h = self.margin * 2 + self.cell * n
 
@@ -596,8 +1002,16 @@ class GalaxiesUI(tk.Tk):
         self.canvas.bind("<ButtonRelease-3>", self.on_arrow_release)
 
         self.dragging_arrow = None
-
-        self.status = tk.StringVar(value=f"Difficulty: {self.grid_size}x{self.grid_size} | Draw lines to separate galaxies. Right-click dots to place arrows.")
+        # Puzzle and (N, cell) layout whose static items are on the canvas, and wall canvas ids by edge
+        self._drawn_puzzle = None
+        self._drawn_layout = None
+        self._status_key = None  # (puzzle, rev) the status line was last built for
+        self._redraw_pending = False
+        self._auto_move_id = None  # after() id of the scheduled auto computer move
+        self.wall_ids = {}
+        self.arrow_ids = {}  # (cell_x, cell_y) -> (Arrow drawn, canvas id or None)
+
+        self.status = tk.StringVar(value=f"Difficulty: {self.grid_size}x{self.grid_size} | Generating puzzle...")
         tk.Label(self, textvariable=self.status, anchor="w").grid(row=1, column=0, columnspan=8, sticky="we", padx=10)
 
         tk.Button(self, text="New Game", command=self.on_new_game).grid(row=2, column=0, padx=5, pady=8, sticky="we")
@@ -609,16 +1023,26 @@ class GalaxiesUI(tk.Tk):
         tk.Button(self, text="Solve", command=self.on_solve, bg="orange", fg="black").grid(row=2, column=6, padx=5, pady=8, sticky="we")
         tk.Button(self, text="Quit", command=self.destroy).grid(row=2, column=7, padx=5, pady=8, sticky="we")
 
+        # Lay out and paint the (empty) window before generating the puzzle.
+        # update_idletasks only runs geometry/redraw work, not input events,
+        # so no handler can see the window without a game.
+        self.update_idletasks()
+        self.game = GalaxiesGame(n=self.grid_size)
         self.redraw()
 
-    def show_difficulty_menu(self):
-        """Show difficulty selection dialog. Returns grid size (7, 10, 15) or None."""
+    def _ensure_difficulty_window(self):
+        """Build the difficulty dialog once (withdrawn); later calls reuse the same window."""
+        if self._diff_window is not None:
+            return self._diff_window
+
         menu_window = tk.Toplevel(self)
+        menu_window.withdraw()
         menu_window.title("Select Difficulty")
         menu_window.geometry("300x280")
-        menu_window.grab_set()
 
-        selected = tk.IntVar(value=7)
+        self._diff_selected = tk.IntVar(value=7)
+        self._diff_done = tk.IntVar(value=0)  # bumped whenever the dialog is dismissed
+        selected = self._diff_selected
 
         tk.Label(menu_window, text="Select Puzzle Difficulty:", font=("Arial", 12, "bold")).pack(pady=10)
 
@@ -629,15 +1053,35 @@ class GalaxiesUI(tk.Tk):
         tk.Radiobutton(menu_window, text="15x15 Normal", variable=selected, value=15, font=("Arial", 11)).pack(anchor="w", padx=40)
         tk.Radiobutton(menu_window, text="15x15 Unreasonable", variable=selected, value=15, font=("Arial", 11)).pack(anchor="w", padx=40)
 
-        self.menu_result = None
+        def close(result):
+            self.menu_result = result
+            menu_window.grab_release()
+            menu_window.withdraw()
+            self._diff_done.set(self._diff_done.get() + 1)
 
-        def start_game():
-            self.menu_result = selected.get()
-            menu_window.destroy()
+        def on_destroy(event):
+            # main window closed while the dialog is up: stop waiting, rebuild next time
+            if event.widget is menu_window:
+                self._diff_window = None
+                self._diff_done.set(self._diff_done.get() + 1)
 
-        tk.Button(menu_window, text="Start Game", command=start_game, bg="green", fg="white", font=("Arial", 11, "bold")).pack(pady=20)
+        tk.Button(menu_window, text="Start Game", command=lambda: close(selected.get()),
+                  bg="green", fg="white", font=("Arial", 11, "bold")).pack(pady=20)
+        menu_window.protocol("WM_DELETE_WINDOW", lambda: close(None))
+        menu_window.bind("<Destroy>", on_destroy)
 
-        menu_window.wait_window()
+        self._diff_window = menu_window
+        return menu_window
+
+    def show_difficulty_menu(self):
+        """Show difficulty selection dialog. Returns grid size (7, 10, 15) or None."""
+        menu_window = self._ensure_difficulty_window()
+        self._diff_selected.set(self.grid_size)
+        self.menu_result = None
+
+        menu_window.deiconify()
+        menu_window.grab_set()
+        self.wait_variable(self._diff_done)
         return self.menu_result
 
     def on_change_difficulty(self):
@@ -645,9 +1089,9 @@ class GalaxiesUI(tk.Tk):
         new_size = self.show_difficulty_menu()
         if new_size is not None and new_size != self.grid_size:
             self.grid_size = new_size
+            self._cancel_auto_move()
             self.game = GalaxiesGame(n=self.grid_size)
-            self.cell = 40 if self.grid_size >= 15 else (50 if self.grid_size >= 10 else 60)
-            self.dot_r = 7 if self.grid_size >= 15 else 9
+            self.cell, self.dot_r = SIZE_CONFIG[self.grid_size]
             self.redraw()
 
     def gx(self, x):
@@ -659,103 +1103,260 @@ class GalaxiesUI(tk.Tk):
     def redraw(self):
         """
         CANVAS RENDERING:
-        Redraw the entire puzzle grid with all visual elements.
+        Bring the canvas in line with the game state.
+        Static items (grid, dots, border) are built once per puzzle; after that
+        only the dynamic layer is refreshed, touching just the items that changed.
         - Valid regions highlighted in light blue
         - Grid lines
         - Dots (galaxy centers)
         - Walls (drawn edges)
         - Arrows (user-placed markers)
         """
-        self.canvas.delete("all")
-        n = self.game.N
-
-        # Highlight valid regions (light blue)
+        self._redraw_pending = False
+        if self._drawn_puzzle is not self.game.puzzle:
+            self._build_static()
         valid_cells = self.game.get_valid_regions()
-        for cell_id in valid_cells:
-            x, y = cell_id % n, cell_id // n
-            x0, y0 = self.gx(x), self.gy(y)
-            x1, y1 = self.gx(x + 1), self.gy(y + 1)
-            self.canvas.create_rectangle(x0, y0, x1, y1, fill="#b0e0ff", outline="", tags="valid_region")
+        self._refresh_dynamic(valid_cells)
 
-        # grid
-        for i in range(n + 1):
-            x = self.gx(i)
-            self.canvas.create_line(x, self.gy(0), x, self.gy(n), width=self.grid_w, fill="#9a9a9a")
-            y = self.gy(i)
-            self.canvas.create_line(self.gx(0), y, self.gx(n), y, width=self.grid_w, fill="#9a9a9a")
+        # status: depends only on the game state, so skip it (and the label
+        # update) when only arrows changed; the region count comes from the
+        # same cached pass as valid_cells
+        status_key = (self.game.puzzle, self.game.rev)
+        if status_key == self._status_key:
+            return
+        self._status_key = status_key
+        region_count = self.game.region_count()
+        valid_count = len(valid_cells)
+
+        msg = f"Lines placed: {self.game.user_edge_count} | Regions: {region_count} | Valid regions: {valid_count}/{len(self.game.puzzle.rects)}"
+        if valid_count == len(self.game.puzzle.rects):
+            msg += " | ✓ All regions valid!"
+        self.status.set(msg)
+
+    def _request_redraw(self):
+        """Schedule a redraw for the next idle cycle; repeated requests coalesce into one."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Run a pending redraw now (no-op if a redraw already happened since the request)."""
+        if self._redraw_pending:
+            self.redraw()
+
+    def _build_static(self):
+        """
+        Draw the items that only change with the puzzle.
+        The grid, highlight cells, fixed walls and border depend only on the board
+        layout, so a new puzzle of the same size keeps them and only swaps the
+        dots, player walls and arrows (tag-scoped deletes instead of "all").
+        """
+        n = self.game.N
+        self._drawn_puzzle = self.game.puzzle
+        self._cache_geometry()
+        xs, ys = self.xs, self.ys
+
+        layout = (n, self.cell)
+        if self._drawn_layout == layout:
+            self.canvas.delete("dot", "player_wall", "arrow")
+            self.wall_ids = {}
+            self.arrow_ids = {}
+            self._drawn_bits = self.game.border_bits(n)
+        else:
+            self._build_layout()
+            self._drawn_layout = layout
 
         # dots
-        for dot_idx, (dx, dy) in enumerate(self.game.puzzle.dots):
-            cx = self.gx(dx); cy = self.gy(dy)
+        for dot_idx, (cx, cy) in enumerate(self.dot_px):
             self.canvas.create_oval(cx - self.dot_r, cy - self.dot_r, cx + self.dot_r, cy + self.dot_r,
-                                    outline="black", width=2, fill="white", tags=f"dot_{dot_idx}")
-
-        # arrows (pointing to dots)
-        for arrow_idx, arrow in enumerate(self.game.arrows):
-            cell_cx = self.gx(arrow.cell_x + 0.5)
-            cell_cy = self.gy(arrow.cell_y + 0.5)
-            dot_x, dot_y = self.game.puzzle.dots[arrow.dot_idx]
-            dot_cx = self.gx(dot_x)
-            dot_cy = self.gy(dot_y)
-
-            # Draw arrow from cell to dot
-            dx = dot_cx - cell_cx
-            dy = dot_cy - cell_cy
-            dist = (dx**2 + dy**2) ** 0.5
-            if dist > 0:
-                dx /= dist
-                dy /= dist
-                end_x = cell_cx + dx * self.arrow_len
-                end_y = cell_cy + dy * self.arrow_len
-                self.canvas.create_line(cell_cx, cell_cy, end_x, end_y, width=2, fill="green", arrow="last", tags=f"arrow_{arrow_idx}")
-
-        # walls
-        for (t, x, y) in sorted(self.game.edges):
-            if t == 'h':
-                x0, y0 = self.gx(x), self.gy(y)
-                x1, y1 = self.gx(x + 1), self.gy(y)
-            else:
-                x0, y0 = self.gx(x), self.gy(y)
-                x1, y1 = self.gx(x), self.gy(y + 1)
-            self.canvas.create_line(x0, y0, x1, y1, width=self.wall_w, fill="black", capstyle=tk.ROUND)
+                                    outline="black", width=2, fill="white", tags=("dot", f"dot_{dot_idx}"))
 
-        # bold border
-        self.canvas.create_rectangle(self.gx(0), self.gy(0), self.gx(n), self.gy(n),
-                                     outline="black", width=8)
+    def _build_layout(self):
+        """Clear the canvas and draw the items that depend only on board size and cell size."""
+        self.canvas.delete("all")
+        self.wall_ids = {}
+        self.arrow_ids = {}
+        n = self.game.N
+        self._drawn_bits = self.game.border_bits(n)  # edges currently on the canvas
+        xs, ys = self.xs, self.ys
+
+        size = self.margin * 2 + self.cell * n
+        self.canvas.config(width=size, height=size)
+
+        # one highlight rectangle per cell, hidden until its region is valid; kept below the grid
+        self.cell_rect_ids = [
+            self.canvas.create_rectangle(xs[x], ys[y], xs[x + 1], ys[y + 1], fill="#b0e0ff", outline="",
+                                         state="hidden", tags="valid_region")
+            for y in range(n) for x in range(n)
+        ]
+        self._prev_valid = set()
+
+        # grid: one serpentine polyline per axis; the connecting hops run along
+        # the outer edge, which the border rectangle covers
+        h_pts, v_pts = [], []
+        for i in range(n + 1):
+            a, b = (0, n) if i % 2 == 0 else (n, 0)
+            h_pts += (xs[a], ys[i], xs[b], ys[i])
+            v_pts += (xs[i], ys[a], xs[i], ys[b])
+        self.canvas.create_line(*h_pts, width=self.grid_w, fill="#9a9a9a", tags="grid")
+        self.canvas.create_line(*v_pts, width=self.grid_w, fill="#9a9a9a", tags="grid")
 
-        # status
-        adj = self.game.cell_adj_graph()
-        comps = bfs_components(adj, n * n)
-        valid_count = len(self.game.get_valid_regions())
+        # fixed walls never change within a puzzle: one polyline per straight run
+        for x0, y0, x1, y1 in self.wall_runs(self.game.fixed):
+            self.canvas.create_line(xs[x0], ys[y0], xs[x1], ys[y1], width=self.wall_w, fill="black",
+                                    capstyle=tk.ROUND, tags=("wall", "fixed_wall"))
 
-        msg = f"Lines placed: {len(self.game.edges - self.game.fixed)} | Regions: {len(comps)} | Valid regions: {valid_count}/{len(self.game.puzzle.rects)}"
-        if valid_count == len(self.game.puzzle.rects):
-            msg += " | ✓ All regions valid!"
-        self.status.set(msg)
+        # bold border
+        self.canvas.create_rectangle(xs[0], ys[0], xs[n], ys[n],
+                                     outline="black", width=8, tags="border")
 
-    def edge_from_click(self, px, py):
-        """Convert pixel coordinates to edge tuple."""
+    @staticmethod
+    def wall_runs(edges):
+        """
+        Merge edges into maximal straight runs.
+        Returns (x0, y0, x1, y1) grid-point segments, one per run of collinear,
+        touching edges, so a run can be drawn with a single create_line.
+        """
+        h = sorted((y, x) for t, x, y in edges if t == 'h')
+        v = sorted((x, y) for t, x, y in edges if t == 'v')
+        runs = []
+        for flip, segs in ((False, h), (True, v)):
+            i = 0
+            while i < len(segs):
+                line, start = segs[i]
+                end = start + 1
+                i += 1
+                while i < len(segs) and segs[i] == (line, end):
+                    end += 1
+                    i += 1
+                runs.append((line, start, line, end) if flip else (start, line, end, line))
+        return runs
+
+    def _cache_geometry(self):
+        """
+        Precompute pixel positions for the current puzzle and cell size:
+        grid-line offsets xs[i]/ys[i] (= gx(i)/gy(i)), cell centres mids[i]
+        (= gx(i + 0.5)), dot centres dot_px[d],
+        dots by half-cell lattice point and the right-click snap radius (plain
+        and squared).  Also clears the arrow cache.
+        """
         n = self.game.N
-        gx = (px - self.margin) / self.cell
-        gy = (py - self.margin) / self.cell
-        if gx < -0.2 or gy < -0.2 or gx > n + 0.2 or gy > n + 0.2:
-            return None
+        self.xs = [self.margin + i * self.cell for i in range(n + 1)]
+        self.ys = self.xs  # square grid: identical offsets on both axes
+        self.mids = [x + self.cell / 2 for x in self.xs[:-1]]
+        self.dot_px = [(self.gx(dx), self.gy(dy)) for dx, dy in self.game.puzzle.dots]
+        # Dots sit on half-cell lattice points, one dot per point at most
+        self.dot_at_half = {(int(2 * dx), int(2 * dy)): dot_idx
+                            for dot_idx, (dx, dy) in enumerate(self.game.puzzle.dots)}
+        self.board_px = n * self.cell
+        self.click_lo = -0.2 * self.cell  # clicks up to 0.2 cell outside the board still count
+        self.click_hi = self.board_px - self.click_lo
+        self.snap_px = self.snap_tol * self.cell
+        self.snap_px_sq = self.snap_px ** 2
+        self._arrow_px = {}  # Arrow -> line coords, filled lazily by _refresh_dynamic
+
+    def _refresh_dynamic(self, valid_cells):
+        """Update highlights, walls and arrows, touching only the items whose state changed."""
+        n = self.game.N
+        xs, ys = self.xs, self.ys
+
+        # Highlight valid regions (light blue): only show/hide the cells that changed
+        prev = self._prev_valid
+        for cell_id in prev - valid_cells:
+            self.canvas.itemconfig(self.cell_rect_ids[cell_id], state="hidden")
+        for cell_id in valid_cells - prev:
+            self.canvas.itemconfig(self.cell_rect_ids[cell_id], state="normal")
+        self._prev_valid = valid_cells  # read-only, replaced (not mutated) by the game
+
+        # player walls: only edges whose bit changed since the last redraw are touched
+        # (fixed walls are static and already in self._drawn_bits)
+        bits = self.game.edge_bits
+        changed = bits ^ self._drawn_bits
+        self._drawn_bits = bits
+        edge_at = index_edges(n)
+        while changed:
+            low = changed & -changed
+            changed ^= low
+            edge = edge_at[low.bit_length() - 1]
+            if not bits & low:
+                self.canvas.delete(self.wall_ids.pop(edge))
+                continue
+            t, x, y = edge
+            if t == 'h':
+                x0, y0 = xs[x], ys[y]
+                x1, y1 = xs[x + 1], ys[y]
+            else:
+                x0, y0 = xs[x], ys[y]
+                x1, y1 = xs[x], ys[y + 1]
+            self.wall_ids[edge] = self.canvas.create_line(x0, y0, x1, y1, width=self.wall_w, fill="black",
+                                                          capstyle=tk.ROUND, tags=("wall", "player_wall"))
+        self.canvas.tag_raise("border")
+
+        # arrows (pointing to dots): diffed per cell against self.arrow_ids; a
+        # retargeted arrow keeps its canvas item and only gets new coords
+        arrows = self.game.arrows_by_cell
+        for cell in [cell for cell in self.arrow_ids if cell not in arrows]:
+            item = self.arrow_ids.pop(cell)[1]
+            if item is not None:
+                self.canvas.delete(item)
+        arrow_px = self._arrow_px
+        for cell, arrow in arrows.items():
+            drawn = self.arrow_ids.get(cell)
+            if drawn is not None and drawn[0] == arrow:
+                continue
+            coords = arrow_px.get(arrow)
+            if coords is None:
+                coords = arrow_px[arrow] = self._arrow_coords(arrow)
+            item = drawn[1] if drawn is not None else None
+            if item is not None and coords:
+                self.canvas.coords(item, *coords)
+            else:
+                if item is not None:
+                    self.canvas.delete(item)
+                item = None
+                if coords:
+                    item = self.canvas.create_line(*coords, width=2, fill="green", arrow="last",
+                                                   tags=("arrow", f"arrow_{cell[0]}_{cell[1]}"))
+            self.arrow_ids[cell] = (arrow, item)
+
+    def _arrow_coords(self, arrow):
+        """
+        Pixel segment (x0, y0, x1, y1) for an arrow: from the cell centre,
+        arrow_len pixels towards its dot.  Empty if the dot is at the cell centre.
+        """
+        cell_cx = self.mids[arrow.cell_x]
+        cell_cy = self.mids[arrow.cell_y]
+        dot_cx, dot_cy = self.dot_px[arrow.dot_idx]
+
+        dx = dot_cx - cell_cx
+        dy = dot_cy - cell_cy
+        dist = (dx**2 + dy**2) ** 0.5
+        if dist == 0:
+            return ()
+        scale = self.arrow_len / dist
+        return (cell_cx, cell_cy, cell_cx + dx * scale, cell_cy + dy * scale)
 
-        rx, ry = round(gx), round(gy)
-        dx, dy = abs(gx - rx), abs(gy - ry)
-        if min(dx, dy) > self.snap_tol:
+    def edge_from_click(self, px, py):
+        """Convert pixel coordinates to edge tuple."""
+        cell = self.cell
+        ox, oy = px - self.margin, py - self.margin
+        lo, hi = self.click_lo, self.click_hi
+        if not (lo <= ox <= hi and lo <= oy <= hi):
             return None
 
+        # Work in pixels: the cell index and offset inside it come from one divmod
+        # per axis (all-integer for Tk's integer event coordinates).  The nearer
+        # grid line picks the orientation and must be within snap range; only the
+        # along-line index needs a bound check (the -0.2 cell overhang maps to 0).
+        cx, ox_in = divmod(ox, cell)
+        cy, oy_in = divmod(oy, cell)
+        dx, rx = (ox_in, cx) if 2 * ox_in <= cell else (cell - ox_in, cx + 1)
+        dy, ry = (oy_in, cy) if 2 * oy_in <= cell else (cell - oy_in, cy + 1)
         if dx < dy:
-            x = int(rx)
-            y = int(gy)
-            if 0 <= x <= n and 0 <= y < n:
-                return ('v', x, y)
-        else:
-            x = int(gx)
-            y = int(ry)
-            if 0 <= x < n and 0 <= y <= n:
-                return ('h', x, y)
+            if dx <= self.snap_px and oy < self.board_px:
+                return ('v', rx, max(cy, 0))
+        elif dy <= self.snap_px and ox < self.board_px:
+            return ('h', max(cx, 0), ry)
         return None
 
     def on_click(self, event):
@@ -765,15 +1366,25 @@ class GalaxiesUI(tk.Tk):
             return
 
         self.game.toggle_edge(edge, who="player")
-        self.redraw()
+        self._request_redraw()
 
         # AUTO COMPUTER MOVE: After player moves, computer automatically makes a greedy move
+        # (a newer click replaces the pending move instead of queueing a second one)
+        self._cancel_auto_move()
         if not self.game.is_solved():
-            self.after(500, self.auto_computer_move)
+            self._auto_move_id = self.after(500, self.auto_computer_move)
+
+    def _cancel_auto_move(self):
+        """Drop the scheduled auto computer move, if any."""
+        if self._auto_move_id is not None:
+            self.after_cancel(self._auto_move_id)
+            self._auto_move_id = None
 
     def auto_computer_move(self):
         """Computer automatically makes a greedy move after player's move."""
+        self._auto_move_id = None
         if self.game.is_solved():
+            self._flush_redraw()
             messagebox.showinfo("Galaxies", "Puzzle solved! Congratulations!")
             return
 
@@ -785,6 +1396,8 @@ class GalaxiesUI(tk.Tk):
 
     def on_right_click(self, event):
         """EVENT: Right-click on a dot to place an arrow from clicked cell to that dot."""
+        if self._drawn_puzzle is not self.game.puzzle:
+            self._flush_redraw()  # dot positions are cached by the static layer
         n = self.game.N
         px, py = event.x, event.y
 
@@ -792,19 +1405,15 @@ class GalaxiesUI(tk.Tk):
         gx = (px - self.margin) / self.cell
         gy = (py - self.margin) / self.cell
 
-        # Find nearest dot within snap tolerance
-        nearest_dot = None
-        nearest_dist = self.snap_tol * self.cell
-        for dot_idx, (dx, dy) in enumerate(self.game.puzzle.dots):
-            cx = self.gx(dx)
-            cy = self.gy(dy)
-            dist = ((px - cx)**2 + (py - cy)**2) ** 0.5
-            if dist < nearest_dist:
-                nearest_dist = dist
-                nearest_dot = dot_idx
-
+        # Find nearest dot within snap tolerance.  The snap radius is under a
+        # quarter cell, so only the dot on the nearest half-cell lattice point
+        # can be in range: one dict lookup instead of a scan over every dot.
+        nearest_dot = self.dot_at_half.get((round(2 * gx), round(2 * gy)))
         if nearest_dot is None:
             return
+        cx, cy = self.dot_px[nearest_dot]
+        if (px - cx)**2 + (py - cy)**2 >= self.snap_px_sq:
+            return
 
         # Find which cell we're in (or closest to)
         cell_x = int(round(gx))
@@ -812,17 +1421,9 @@ class GalaxiesUI(tk.Tk):
         if not (0 <= cell_x < n and 0 <= cell_y < n):
             return
 
-        # Check if this arrow already exists
-        for i, arrow in enumerate(self.game.arrows):
-            if arrow.cell_x == cell_x and arrow.cell_y == cell_y:
-                # Move existing arrow to new dot
-                self.game.arrows[i] = Arrow(cell_x, cell_y, nearest_dot)
-                self.redraw()
-                return
-
-        # Create new arrow
-        self.game.arrows.append(Arrow(cell_x, cell_y, nearest_dot))
-        self.redraw()
+        # Create the arrow, or move an existing one in this cell to the new dot
+        self.game.arrows_by_cell[(cell_x, cell_y)] = Arrow(cell_x, cell_y, nearest_dot)
+        self._request_redraw()
 
     def on_arrow_drag(self, event):
         """EVENT: Drag an arrow (currently not used, but could enable arrow repositioning)."""
@@ -840,8 +1441,8 @@ class GalaxiesUI(tk.Tk):
             # Remove arrow near nearest cell to release point
             cell_x = int(round(gx))
             cell_y = int(round(gy))
-            self.game.arrows = [a for a in self.game.arrows if not (a.cell_x == cell_x and a.cell_y == cell_y)]
-            self.redraw()
+            if self.game.arrows_by_cell.pop((cell_x, cell_y), None) is not None:
+                self._request_redraw()
 
     def do_computer_turn(self):
         """Helper: Computer makes one move."""
@@ -855,17 +1456,20 @@ class GalaxiesUI(tk.Tk):
     
     def on_new_game(self):
         """BUTTON: New Game - Generate new puzzle."""
+        self._cancel_auto_move()
         self.game.new_puzzle()
-        self.redraw()
+        self._request_redraw()
 
     def on_restart(self):
         """BUTTON: Restart - Reset current puzzle."""
+        self._cancel_auto_move()
         self.game.reset()
-        self.redraw()
+        self._request_redraw()
 
     def on_solve(self):
         """BUTTON: Solve - Show solution."""
-        self.game.edges = set(self.game.fixed) | set(self.game.solution)
+        self._cancel_auto_move()
+        self.game.solve()
         self.redraw()
         messagebox.showinfo("Galaxies", "Solution drawn (for reference).")
 
@@ -880,12 +1484,12 @@ class GalaxiesUI(tk.Tk):
     def on_undo(self):
         """BUTTON: Undo - Undo last move."""
         if self.game.undo():
-            self.redraw()
+            self._request_redraw()
 
     def on_redo(self):
         """BUTTON: Redo - Redo last undone move."""
         if self.game.redo():
-            self.redraw()
+            self._request_redraw()
 
 
 if __name__ == "__main__":
@@ -54,9 +54,12 @@ Run:
 
 import tkinter as tk
 from tkinter import messagebox
-from collections import deque, defaultdict
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
+from array import array
 
+import heapq
 import random
 
 
@@ -196,14 +199,11 @@ def has_rotational_symmetry(region_cells, dot_x, dot_y, n):
 
 
 def count_dots_in_region(region_cells, dots):
-    # TC: O(R*D), SC: O(1)
-    count = 0
-    for dot_x, dot_y in dots:
-        for x, y in region_cells:
-            if x <= dot_x < x + 1 and y <= dot_y < y + 1:
-                count += 1
-                break
-    return count
+    # A dot lies in exactly one cell: (floor(dot_x), floor(dot_y))
+    # TC: O(D), SC: O(1)
+    if not isinstance(region_cells, (set, frozenset)):
+        region_cells = set(region_cells)
+    return sum(1 for dot_x, dot_y in dots if (int(dot_x), int(dot_y)) in region_cells)
 
 
 def is_region_valid(region_cells, dot_x, dot_y, dots, n):
@@ -221,6 +221,136 @@ def is_region_valid(region_cells, dot_x, dot_y, dots, n):
     return True
 
 
+# ---------------------------
+# Union-find over grid cells
+# ---------------------------
+
+class DSU:
+    """
+    UNION-FIND (Disjoint Set Union):
+    Tracks which cells are connected, with path compression (halving) and
+    union by rank.
+
+    TC: O(α(n)) amortized per find/union, SC: O(n)
+    """
+
+    def __init__(self, size):
+        self.parent = list(range(size))
+        self.rank = [0] * size
+        self.count = size  # number of disjoint sets
+
+    def find(self, u):
+        parent = self.parent
+        while parent[u] != u:
+            parent[u] = parent[parent[u]]
+            u = parent[u]
+        return u
+
+    def union(self, a, b):
+        """Merge the sets of a and b; returns False if they were already joined."""
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return False
+        if self.rank[a] < self.rank[b]:
+            a, b = b, a
+        self.parent[b] = a
+        if self.rank[a] == self.rank[b]:
+            self.rank[a] += 1
+        self.count -= 1
+        return True
+
+    def groups(self):
+        """Return {root -> set of members}, keyed in order of each group's smallest member."""
+        groups = defaultdict(set)
+        if self.count == 1:
+            # everything is connected: no per-member find() needed
+            groups[self.find(0)] = set(range(len(self.parent)))
+            return groups
+        for u in range(len(self.parent)):
+            groups[self.find(u)].add(u)
+        return groups
+
+
+def edge_index(edge, n):
+    """
+    Pack an edge ('h'|'v', x, y) into an integer index in [0, 2*(n+1)²).
+    Horizontal edges occupy the first (n+1)² slots, vertical edges the rest.
+    """
+    t, x, y = edge
+    return (0 if t == 'h' else (n + 1) * (n + 1)) + y * (n + 1) + x
+
+
+def edge_bitmap(edges, n):
+    """Build a bytearray bitmap (1 = blocked) over edge_index() for a set of edges."""
+    blocked = bytearray(2 * (n + 1) * (n + 1))
+    for e in edges:
+        blocked[edge_index(e, n)] = 1
+    return blocked
+
+
+@lru_cache(maxsize=None)
+def internal_edges(n):
+    """
+    Every interior wall of the N x N grid as (edge_index, cell_a, cell_b),
+    so union-find passes test one bitmap byte per wall instead of hashing
+    ('h'|'v', x, y) tuples.  Built once per grid size (read-only tuple).
+
+    TC: O(N²), SC: O(N²)
+    """
+    stride = n + 1
+    v_base = stride * stride
+    pairs = []
+    for y in range(n):
+        for x in range(n):
+            u = y * n + x
+            if x + 1 < n:
+                pairs.append((v_base + y * stride + x + 1, u, u + 1))
+            if y + 1 < n:
+                pairs.append(((y + 1) * stride + x, u, u + n))
+    return tuple(pairs)
+
+
+@lru_cache(maxsize=None)
+def cell_neighbours(n):
+    """cell_id -> ((neighbour cell_id, edge_index of the wall between them), ...), once per grid size."""
+    nbrs = [[] for _ in range(n * n)]
+    for w, u, v in internal_edges(n):
+        nbrs[u].append((v, w))
+        nbrs[v].append((u, w))
+    return tuple(tuple(cell) for cell in nbrs)
+
+
+def cell_dsu(n, blocked, pairs=None):
+    """
+    Union every pair of neighbouring cells whose shared wall is not set in
+    the edge bitmap `blocked`.  `pairs` is internal_edges(n), if the caller
+    already has it.
+
+    TC: O(N² · α(N²)), SC: O(N²)
+    """
+    dsu = DSU(n * n)
+    for w, u, v in (pairs if pairs is not None else internal_edges(n)):
+        if not blocked[w]:
+            dsu.union(u, v)
+    return dsu
+
+
+def cells_mask(cells):
+    """Bitmask of a collection of cell IDs: bit cid is set for every member."""
+    mask = 0
+    for cid in cells:
+        mask |= 1 << cid
+    return mask
+
+
+def edge_cells(edge, n):
+    """Return the two cell IDs separated by an interior edge ('h'|'v', x, y)."""
+    t, x, y = edge
+    if t == 'v':
+        return y * n + x - 1, y * n + x
+    return (y - 1) * n + x, y * n + x
+
+
 # ---------------------------
 # Game state
 # ---------------------------
@@ -257,7 +387,7 @@ class GalaxiesModel:
       - solution_edges: target edges for solver to find
     
     Methods:
-      - Graph operations: cell_adjacency_graph(), build_regions_from_edges()
+      - Graph operations: cell_adjacency_graph(), cell_adjacency_csr(), build_regions_from_edges()
       - Greedy hints: compute_edge_scores(), select_best_edge()
       - Sorting: sort_edges_by_score(), sort_regions_by_size()
       - Validation: is_valid_region(), get_valid_regions()
@@ -272,11 +402,24 @@ class GalaxiesModel:
         self.undo_stack = []
         self.redo_stack = []
         self.solution_edges = set()
+        # Region partition of the last edge set seen by build_regions_from_edges()
+        self._regions_key = None
+        self._regions_cache = None
+        # Cell id holding each dot, and the same cells as one bitmask (set per puzzle)
+        self.dot_cell_ids = []
+        self.dot_mask = 0
+        # Every wall that can be drawn (the border is fixed), fixed for this N
+        border = GalaxiesGame.border_edges(n)
+        self._interior_edges = [e for e in ([('h', x, y) for x in range(n) for y in range(n + 1)]
+                                            + [('v', x, y) for x in range(n + 1) for y in range(n)])
+                                if e not in border]
     
     def new_puzzle(self):
         """Generate a new puzzle."""
         self.puzzle.generate()
         self.solution_edges = self.puzzle.solution_edges.copy()
+        self.dot_cell_ids = [int(dy) * self.N + int(dx) for dx, dy in self.puzzle.dots]
+        self.dot_mask = cells_mask(self.dot_cell_ids)
         self.edges = set()
         self.arrows = []
         self.undo_stack = []
@@ -319,44 +462,75 @@ class GalaxiesModel:
                     adj[cell_id].append(neighbor_id)
                     adj[neighbor_id].append(cell_id)
         
-        # Remove duplicates
-        for k in adj:
-            adj[k] = list(set(adj[k]))
-        
+        # Each open wall is visited once (from its left/top cell), so the
+        # lists never hold duplicates
         return dict(adj)
     
+    def cell_adjacency_csr(self):
+        """
+        BUILD ADJACENCY (CSR):
+        Same graph as cell_adjacency_graph(), as two flat arrays: the
+        neighbours of u are indices[indptr[u]:indptr[u+1]].  Built by counting
+        degrees, prefix-summing into indptr, then filling indices.
+        
+        TC: O(N² + |edges|)
+        SC: O(N²)
+        
+        Returns:
+          (indptr, indices): array('i') of length N²+1 and array('i') of neighbours
+        """
+        n = self.N
+        nn = n * n
+        edges = self.edges
+        open_pairs = []
+        for y in range(n):
+            for x in range(n):
+                cell_id = y * n + x
+                if x + 1 < n and ('v', x + 1, y) not in edges:
+                    open_pairs.append((cell_id, cell_id + 1))
+                if y + 1 < n and ('h', x, y + 1) not in edges:
+                    open_pairs.append((cell_id, cell_id + n))
+        
+        indptr = array('i', bytes(4 * (nn + 1)))
+        for u, v in open_pairs:
+            indptr[u + 1] += 1
+            indptr[v + 1] += 1
+        for i in range(nn):
+            indptr[i + 1] += indptr[i]
+        
+        indices = array('i', bytes(4 * indptr[nn]))
+        fill = indptr[:nn]
+        for u, v in open_pairs:
+            indices[fill[u]] = v
+            fill[u] += 1
+            indices[fill[v]] = u
+            fill[v] += 1
+        return indptr, indices
+    
     def build_regions_from_edges(self):
         """
-        GRAPH TRAVERSAL (BFS):
+        GRAPH CONNECTIVITY (UNION-FIND):
         Find all connected components (regions) from current edges.
-        Uses BFS to explore connected cells without drawn edges.
+        Unions every pair of neighbouring cells without a drawn edge between them.
         
-        TC: O(V+E) where V=cells, E=adjacency edges
+        TC: O(V · α(V)) where V=cells
         SC: O(V)
         
+        The partition is cached against the edge set it was built from, so
+        repeated calls (redraws, hint scoring) between edge changes skip the
+        rebuild.  Callers must treat the returned regions as read-only.
+        
         Returns:
           list: [set of cells, ...] for each region
         """
-        adj = self.cell_adjacency_graph()
-        seen = set()
-        regions = []
+        # Compare in place; the edge set is only copied when the cache is rebuilt
+        if self._regions_key is not None and self.edges == self._regions_key:
+            return self._regions_cache
         
-        for start in range(self.N * self.N):
-            if start in seen:
-                continue
-            # BFS from this cell
-            region = set()
-            q = deque([start])
-            seen.add(start)
-            while q:
-                cell = q.popleft()
-                region.add(cell)
-                for neighbor in adj.get(cell, []):
-                    if neighbor not in seen:
-                        seen.add(neighbor)
-                        q.append(neighbor)
-            regions.append(region)
+        regions = list(cell_dsu(self.N, edge_bitmap(self.edges, self.N)).groups().values())
         
+        self._regions_key = frozenset(self.edges)
+        self._regions_cache = regions
         return regions
     
     # ==============================
@@ -375,8 +549,8 @@ class GalaxiesModel:
         
         Greedy choice: Select edge with maximum total score
         
-        TC: O(E * |regions| * D) where E=edges, D=dots
-        SC: O(E)
+        TC: O(V + E) where V=cells, E=edges (one bridge-finding DFS)
+        SC: O(V + E)
         
         Returns:
           dict: {edge -> score} for all potential edges
@@ -384,41 +558,84 @@ class GalaxiesModel:
         n = self.N
         scores = {}
         
-        # All possible edges
-        all_edges = set()
-        for x in range(n):
-            for y in range(n + 1):
-                all_edges.add(('h', x, y))
-            for y in range(n):
-                all_edges.add(('v', x, y))
-        for x in range(n + 1):
-            for y in range(n):
-                all_edges.add(('v', x, y))
-        
-        # Border edges already fixed
-        border = set(GalaxiesGame.border_edges(n))
-        
-        for edge in all_edges:
-            if edge in border or edge in self.edges:
-                continue
-            
-            # Try adding this edge temporarily
-            self.edges.add(edge)
-            regions = self.build_regions_from_edges()
+        # Baseline partition, computed once.  Adding one edge can only split
+        # the single region that contains both of its cells, and only if the
+        # edge is a bridge of that region's cell graph.
+        regions = self.build_regions_from_edges()
+        indptr, indices = self.cell_adjacency_csr()
+        
+        # Regions as cell bitmasks: a dot count is one AND against the dot cells
+        dot_mask = self.dot_mask
+        region_masks = [cells_mask(region) for region in regions]
+        
+        def region_score(size, dots):
+            # Non-trivial regions are rewarded for size, one-dot regions heavily
+            score = size * 0.5 if size < n else 0
+            if dots == 1:
+                score += 10
+            return score
+        
+        # One DFS per region finds every bridge (Tarjan low-links) together with
+        # the size and dot count of the subtree it cuts off, so every candidate
+        # is scored from the same pass instead of a search per edge.
+        disc = [-1] * (n * n)
+        low = [0] * (n * n)
+        sub_size = [0] * (n * n)
+        sub_dots = [0] * (n * n)
+        split_delta = {}
+        region_scores = []
+        timer = 0
+        for mask, region in zip(region_masks, regions):
+            size = len(region)
+            dots = self._count_region_dots(mask, dot_mask)
+            old = region_score(size, dots)
+            region_scores.append(old)
             
-            # Score based on region separation
-            score = 0
-            for region in regions:
-                if len(region) < self.N:  # Non-trivial region
-                    score += len(region) * 0.5  # Prefer balanced regions
+            root = min(region)
+            disc[root] = low[root] = timer
+            timer += 1
+            sub_size[root] = 1
+            sub_dots[root] = (dot_mask >> root) & 1
+            stack = [(root, -1, iter(indices[indptr[root]:indptr[root + 1]]))]
+            while stack:
+                u, parent, nbrs = stack[-1]
+                for v in nbrs:
+                    if v == parent:
+                        continue
+                    if disc[v] >= 0:
+                        low[u] = min(low[u], disc[v])
+                    else:
+                        disc[v] = low[v] = timer
+                        timer += 1
+                        sub_size[v] = 1
+                        sub_dots[v] = (dot_mask >> v) & 1
+                        stack.append((v, u, iter(indices[indptr[v]:indptr[v + 1]])))
+                        break
+                else:
+                    stack.pop()
+                    if parent < 0:
+                        continue
+                    low[parent] = min(low[parent], low[u])
+                    sub_size[parent] += sub_size[u]
+                    sub_dots[parent] += sub_dots[u]
+                    if low[u] > disc[parent]:
+                        # Wall between parent and u cuts u's subtree off the region
+                        a, b = min(parent, u), max(parent, u)
+                        wall = ('v' if b - a == 1 else 'h', b % n, b // n)
+                        split_delta[wall] = (region_score(sub_size[u], sub_dots[u])
+                                             + region_score(size - sub_size[u], dots - sub_dots[u])
+                                             - old)
+        base_score = sum(region_scores)
+        
+        for edge in self._interior_edges:
+            if edge in self.edges:
+                continue
             
-            # Score based on having exactly one dot per region
-            valid_count = sum(1 for region in regions 
-                            if self._count_region_dots(region) == 1)
-            score += valid_count * 10  # Heavily reward valid regions
+            score = base_score
+            if edge in split_delta:
+                score += split_delta[edge]
             
             scores[edge] = score
-            self.edges.remove(edge)
         
         return scores
     
@@ -437,20 +654,18 @@ class GalaxiesModel:
         if not scores:
             return None, 0
         
-        # Greedy choice: max score
-        best_edge = max(scores.items(), key=lambda x: x[1])
-        return best_edge
+        # Greedy choice: one streaming max over the keys, no (edge, score) pairs
+        best_edge = max(scores, key=scores.get)
+        return best_edge, scores[best_edge]
     
-    def _count_region_dots(self, region):
-        """Count dots contained in a region."""
-        count = 0
-        for dot_x, dot_y in self.puzzle.dots:
-            for cell_id in region:
-                y, x = divmod(cell_id, self.N)
-                if x <= dot_x < x + 1 and y <= dot_y < y + 1:
-                    count += 1
-                    break
-        return count
+    def _count_region_dots(self, region, dot_mask=None):
+        """Count dots contained in a region (a set of cell ids or a cell bitmask)."""
+        if dot_mask is None:
+            dot_mask = self.dot_mask
+        if not isinstance(region, int):
+            # O(D): each dot sits in exactly one cell
+            return sum(1 for cid in self.dot_cell_ids if cid in region)
+        return bin(region & dot_mask).count('1')
     
     # ==============================
     # SORTING: Heuristic Techniques
@@ -515,44 +730,141 @@ class GalaxiesModel:
         return sorted(candidates, key=heuristic)
 
 
+# Max regions remembered by GalaxiesGame.get_valid_regions (least recently used go first)
+VALID_MEMO_SIZE = 4096
+
+# Upper bound of the hint score: 10 (separation) + 5 (validity)
+MAX_GREEDY_SCORE = 15
+
+
 class GalaxiesGame:
     def __init__(self, n = 7, seed = None):
         self.N = n
         self.rng = random.Random(seed)
+        # (edge_index, cell_a, cell_b) for every interior wall; fixed for this N
+        self._internal_edges = internal_edges(n)
+        self._cell_nbrs = cell_neighbours(n)
+        # Bumped on every board change so views can tell when walls need redrawing
+        self.rev = 0
         self.new_puzzle()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def border_edges(n):
-        edges = set()
-        for x in range(n):
-            edges.add(('h', x, 0))
-            edges.add(('h', x, n))
-        for y in range(n):
-            edges.add(('v', 0, y))
-            edges.add(('v', n, y))
-        return edges
+        """Outer border of an N x N grid; built once per N and shared (read-only)."""
+        return frozenset([('h', x, y) for y in (0, n) for x in range(n)] +
+                         [('v', x, y) for x in (0, n) for y in range(n)])
 
     def new_puzzle(self):
         self.puzzle = GalaxiesPuzzle(n=self.N, rng=self.rng)
         self.puzzle.generate()
         self.fixed = self.border_edges(self.N)
-        self.solution = set(self.puzzle.solution_edges) - set(self.fixed)
+        self.solution = self.puzzle.solution_edges - self.fixed
+        # Each dot lies in exactly one cell: (floor(dx), floor(dy))
+        self.dot_cell_ids = [int(dy) * self.N + int(dx) for dx, dy in self.puzzle.dots]
+        # cell_id -> index of the dot inside it (-1 if none), and per dot the
+        # 180° rotation constants: (x, y) -> (sx - x, sy - y), cell id c -> sym - c
+        self.cell_to_dot = [-1] * (self.N * self.N)
+        self.dot_mirror = []
+        for dot_idx, (dx, dy) in enumerate(self.puzzle.dots):
+            self.cell_to_dot[self.dot_cell_ids[dot_idx]] = dot_idx
+            sx, sy = int(2 * dx) - 1, int(2 * dy) - 1
+            self.dot_mirror.append((sx, sy, sy * self.N + sx))
+        # region cell bitmask -> is_component_valid(), in LRU order; only valid for this puzzle's dots
+        self._valid_memo = OrderedDict()
         self.reset()
 
     def reset(self):
         self.edges = set(self.fixed)
+        # Bitmap mirror of self.edges (indexed by edge_index) for the union-find passes
+        self.blocked = edge_bitmap(self.edges, self.N)
+        # |(edges - fixed) ^ solution|: the board is solved exactly when this is 0
+        self._diff = len(self.solution)
         self.history = []
         self.redo_stack = []
-        self.arrows = []
+        self.arrows_by_cell = {}  # (cell_x, cell_y) -> Arrow, in placement order
+        self._dsu = None  # union-find of open cell adjacencies, rebuilt lazily
+        # Lazy-greedy hint heap of (-score bound, seq, edge); _hint_live maps each
+        # edge in it to the (bound, seq) of its current entry, older ones are stale
+        self._hint_heap = []
+        self._hint_live = {}
+        self._hint_seq = 0
+        self.rev += 1
+
+    @property
+    def arrows(self):
+        """Placed arrows as a list (read-only view of arrows_by_cell)."""
+        return list(self.arrows_by_cell.values())
+
+    def _set_edge(self, edge, present):
+        """
+        Add or remove a drawn edge and keep the cell union-find in step:
+        removing a wall just unions its two cells; adding one only forces a
+        rebuild if it cuts through a single region (it may split it).
+        Nothing changes (not even `rev`) if the edge is already in that state.
+        """
+        if (edge in self.edges) == present:
+            return
+        a, b = edge_cells(edge, self.N)
+        # A wall along an existing region boundary changes no region, so no hint score
+        along_boundary = False
+        self.blocked[edge_index(edge, self.N)] = 1 if present else 0
+        self._diff += -1 if (edge in self.solution) == present else 1
+        if present:
+            self.edges.add(edge)
+            if self._dsu is not None:
+                if self._dsu.find(a) == self._dsu.find(b):
+                    self._dsu = None
+                else:
+                    along_boundary = True
+        else:
+            self.edges.discard(edge)
+            if self._dsu is not None:
+                self._dsu.union(a, b)
+        if self._hint_live and not along_boundary:
+            self._bump_hint_bounds(a, b)
+        self.rev += 1
+
+    def _push_hint(self, edge, bound):
+        """Push `edge` onto the hint heap with score bound `bound`, superseding its older entry."""
+        seq = self._hint_seq
+        self._hint_seq += 1
+        self._hint_live[edge] = (bound, seq)
+        heap = self._hint_heap
+        if len(heap) > 2 * len(self._hint_live) + 16:
+            # Mostly superseded entries: rebuild from the live ones
+            heap[:] = [(-b, sq, e) for e, (b, sq) in self._hint_live.items()]
+            heapq.heapify(heap)
+        else:
+            heapq.heappush(heap, (-bound, seq, edge))
+
+    def _bump_hint_bounds(self, a, b):
+        """
+        Give hint candidates touching the region(s) of cells a and b the
+        maximum bound again.  A hint score depends only on the region holding
+        the edge, so after a wall change these (the merged region, or both
+        halves of a split) are the only scores that may have gone up.
+        """
+        n = self.N
+        live = self._hint_live
+        region = self._side_of_cut(a, -1, -1)  # no cut: all of a's region
+        if b not in region:
+            region |= self._side_of_cut(b, -1, -1)
+        for cell_id in region:
+            y, x = divmod(cell_id, n)
+            for e in (('h', x, y), ('h', x, y + 1), ('v', x, y), ('v', x + 1, y)):
+                entry = live.get(e)
+                if entry is not None and entry[0] < MAX_GREEDY_SCORE:
+                    self._push_hint(e, MAX_GREEDY_SCORE)
 
     def toggle_edge(self, edge, who):
         if edge in self.fixed:
             return False
         if edge in self.edges:
-            self.edges.remove(edge)
+            self._set_edge(edge, False)
             self.history.append(Move(edge=edge, added=False, who=who))
         else:
-            self.edges.add(edge)
+            self._set_edge(edge, True)
             self.history.append(Move(edge=edge, added=True, who=who))
         self.redo_stack.clear()
         return True
@@ -561,10 +873,7 @@ class GalaxiesGame:
         if not self.history:
             return False
         mv = self.history.pop()
-        if mv.added:
-            self.edges.discard(mv.edge)
-        else:
-            self.edges.add(mv.edge)
+        self._set_edge(mv.edge, not mv.added)
         self.redo_stack.append(mv)
         return True
 
@@ -572,70 +881,138 @@ class GalaxiesGame:
         if not self.redo_stack:
             return False
         mv = self.redo_stack.pop()
-        if mv.added:
-            self.edges.add(mv.edge)
-        else:
-            self.edges.discard(mv.edge)
+        self._set_edge(mv.edge, mv.added)
         self.history.append(mv)
         return True
 
+    def regions(self):
+        """
+        GRAPH CONNECTIVITY (UNION-FIND):
+        Current regions as {root -> set of cell_ids}.
+        TC: O(n^2) to group; the union-find itself is only rebuilt after a
+        wall was drawn through a region.
+        """
+        if self._dsu is None:
+            self._dsu = cell_dsu(self.N, self.blocked, pairs=self._internal_edges)
+        return self._dsu.groups()
+
+    def region_count(self):
+        """Number of regions, read off the same union-find as regions() without grouping cells."""
+        if self._dsu is None:
+            self._dsu = cell_dsu(self.N, self.blocked, pairs=self._internal_edges)
+        return self._dsu.count
+
+    def solve(self):
+        """Replace the drawn edges with the full solution (border + solution edges)."""
+        self.edges = self.solution | self.fixed  # set | frozenset -> mutable set
+        self.blocked = edge_bitmap(self.edges, self.N)
+        self._diff = 0
+        self._dsu = None
+        self._hint_heap = []
+        self._hint_live = {}
+        self.rev += 1
+
     def is_solved(self):
-        return (self.edges - self.fixed) == self.solution
+        # O(1): _diff is maintained by reset/_set_edge/solve
+        return self._diff == 0
 
     # Cell adjacency graph given current walls
     def cell_adj_graph(self, extra_block=None):
         # TC: O(n^2), SC: O(n^2)
         adj = defaultdict(list)
-        n = self.N
-        blocked = set(self.edges)
-        if extra_block is not None:
-            blocked.add(extra_block)
-
-        def cid(x, y):
-            return y * n + x
-
-        for y in range(n):
-            for x in range(n):
-                u = cid(x, y)
-                if x + 1 < n:
-                    w = ('v', x + 1, y)
-                    if w not in blocked:
-                        v = cid(x + 1, y)
-                        adj[u].append(v); adj[v].append(u)
-                if y + 1 < n:
-                    w = ('h', x, y + 1)
-                    if w not in blocked:
-                        v = cid(x, y + 1)
-                        adj[u].append(v); adj[v].append(u)
+        blocked = self.blocked
+        extra = edge_index(extra_block, self.N) if extra_block is not None else -1
+        for w, u, v in self._internal_edges:
+            if not blocked[w] and w != extra:
+                adj[u].append(v); adj[v].append(u)
         return adj
 
     def get_valid_regions(self):
-        """Returns set of cell_ids that belong to valid regions."""
-        n = self.N
-        adj = self.cell_adj_graph()
-        comps = bfs_components(adj, n * n)
+        """
+        Returns set of cell_ids that belong to valid regions.  Regions a move
+        left untouched hit the per-puzzle memo instead of being re-validated.
+        """
+        memo = self._valid_memo
         valid_cells = set()
+        for comp in self.regions().values():
+            key = cells_mask(comp)
+            ok = memo.get(key)
+            if ok is None:
+                ok = memo[key] = self.is_component_valid(comp)
+                if len(memo) > VALID_MEMO_SIZE:
+                    memo.popitem(last=False)
+            else:
+                memo.move_to_end(key)
+            if ok:
+                valid_cells.update(comp)
+        return valid_cells
 
-        for comp in comps:
-            # Get the cells in this component
-            region_cells = {(cid % n, cid // n) for cid in comp}
-            
-            # Find which dot(s) are in this region
-            dots_in_region = []
-            for dot_idx, (dx, dy) in enumerate(self.puzzle.dots):
-                for x, y in region_cells:
-                    if x <= dx < x + 1 and y <= dy < y + 1:
-                        dots_in_region.append((dot_idx, dx, dy))
-                        break
-            
-            # Must have exactly one dot
-            if len(dots_in_region) == 1:
-                dot_idx, dot_x, dot_y = dots_in_region[0]
-                # Check if region is valid (symmetry + center check)
-                if is_region_valid(region_cells, dot_x, dot_y, self.puzzle.dots, n):
-                    valid_cells.update(comp)
+    def is_component_valid(self, comp):
+        """
+        Check one region (a set of cell_ids) against the rules: exactly one
+        dot, and 180° symmetric about it.  Works on cell ids only, with the
+        same rules as is_region_valid().
+        TC: O(R), SC: O(1) beyond the region bitmask
+        """
+        n = self.N
+        cell_to_dot = self.cell_to_dot
+        # One pass: count the dots, take the bounding box and build the cell bitmask
+        dot_idx = -1
+        dot_count = 0
+        min_x = min_y = n
+        max_x = max_y = -1
+        mask = 0
+        for cid in comp:
+            if cell_to_dot[cid] >= 0:
+                dot_idx = cell_to_dot[cid]
+                dot_count += 1
+            mask |= 1 << cid
+            y, x = divmod(cid, n)
+            if x < min_x:
+                min_x = x
+            if x > max_x:
+                max_x = x
+            if y < min_y:
+                min_y = y
+            if y > max_y:
+                max_y = y
+
+        # Must have exactly one dot
+        if dot_count != 1:
+            return False
 
-        return valid_cells
+        # A symmetric region's bounding box is centred on its dot
+        sx, sy, sym = self.dot_mirror[dot_idx]
+        if min_x + max_x != sx or min_y + max_y != sy:
+            return False
+
+        # Inside that box the rotation never wraps a row, so the region is symmetric
+        # iff its lowest and highest ids pair up and the bitmask reads as a palindrome
+        lo = (mask & -mask).bit_length() - 1
+        if lo + mask.bit_length() - 1 != sym:
+            return False
+        bits = bin(mask).rstrip('0')
+        return bits[2:] == bits[:1:-1]
+
+    def _side_of_cut(self, a, b, cut):
+        """
+        Cells reachable from `a` without crossing drawn walls or the wall `cut`
+        (an edge index), searching only a's region.  Returns None as soon as
+        `b` is reached, i.e. when drawing `cut` would not split the region.
+        """
+        blocked = self.blocked
+        nbrs = self._cell_nbrs
+        seen = {a}
+        stack = [a]
+        while stack:
+            u = stack.pop()
+            for v, w in nbrs[u]:
+                if v not in seen and not blocked[w] and w != cut:
+                    if v == b:
+                        return None
+                    seen.add(v)
+                    stack.append(v)
+        return seen
 
     def computer_move(self):
         """
@@ -644,51 +1021,88 @@ class GalaxiesGame:
         1. Does it separate cells into more regions? (graph connectivity)
         2. Does it help create valid regions? (constraint satisfaction)
         
-        Pick the edge with the highest greedy score.
-        Uses: BFS for connected components (graph traversal)
+        Pick the edge with the highest greedy score, re-scoring lazily from a
+        heap of score bounds so usually only a few edges are scored per move.
+        Uses: union-find for connected components (graph connectivity)
         """
         missing = list(self.solution - (self.edges - self.fixed))
         if not missing:
             return None
 
         n = self.N
+        # One snapshot of the board per move: regions, their roots and which are valid
+        regions = self.regions()
+        dsu = self._dsu
+        valid_cells = self.get_valid_regions()
 
         def greedy_score(edge):
             """
             Greedy scoring function.
             Higher score = better edge to add.
+            Works on the snapshot only: the board is never modified while scoring.
             """
             score = 0
-
-            # Score 1: Does adding this edge create more regions? (using BFS)
-            adj_with_edge = self.cell_adj_graph(extra_block=edge)
-            comps_with = bfs_components(adj_with_edge, n * n)
-
-            adj_without = self.cell_adj_graph()
-            comps_without = bfs_components(adj_without, n * n)
-
-            if len(comps_with) > len(comps_without):
-                score += 10  # Good: creates separation
+            a, b = edge_cells(edge, n)
+            root = dsu.find(a)
+
+            # Score 1: Does adding this edge create more regions? (graph connectivity)
+            # Only a wall through a single region can split it; a search confined
+            # to that region decides, stopping as soon as the far cell is reached.
+            if dsu.find(b) != root:
+                return score
+            side = self._side_of_cut(a, b, edge_index(edge, n))
+            if side is None:
+                return score
+            score += 10  # Good: creates separation
 
             # Score 2: Does it help move toward valid regions?
-            valid_before = len(self.get_valid_regions())
-            self.edges.add(edge)
-            valid_after = len(self.get_valid_regions())
-            self.edges.discard(edge)
-
+            # Only the split region can change validity: compare its valid cells
+            # before and after with the two halves.
+            comp = regions[root]
+            other = comp - side
+            valid_before = len(comp) if a in valid_cells else 0
+            valid_after = ((len(side) if self.is_component_valid(side) else 0) +
+                           (len(other) if self.is_component_valid(other) else 0))
             if valid_after > valid_before:
                 score += 5  # Good: increases valid regions
 
             return score
 
-        # GREEDY: Score each edge and pick the maximum
-        scores = [(greedy_score(e), e) for e in missing]
-        scores.sort(key=lambda p: p[0], reverse=True)
-
-        if scores:
-            best_edge = scores[0][1]
-            self.toggle_edge(best_edge, who="computer")
-            return best_edge
+        # GREEDY (lazy): heap entries hold an upper bound on each edge's score.
+        # Pop the top, re-score it, and take it if it still beats the next
+        # bound; otherwise push it back with its real score.
+        heap = self._hint_heap
+        live = self._hint_live
+        new_edges = [e for e in missing if e not in live]
+        for e in new_edges:
+            heap.append((-MAX_GREEDY_SCORE, self._hint_seq, e))
+            live[e] = (MAX_GREEDY_SCORE, self._hint_seq)
+            self._hint_seq += 1
+        if new_edges:
+            heapq.heapify(heap)
+
+        def is_stale(entry):
+            """An entry superseded by a newer push for the same edge."""
+            _, seq, e = entry
+            return live.get(e, (None, None))[1] != seq
+
+        missing = set(missing)
+        while heap:
+            entry = heapq.heappop(heap)
+            if is_stale(entry):
+                continue
+            e = entry[2]
+            if e not in missing:
+                del live[e]
+                continue
+            s = greedy_score(e)
+            while heap and is_stale(heap[0]):
+                heapq.heappop(heap)
+            if not heap or s >= -heap[0][0]:
+                del live[e]
+                self.toggle_edge(e, who="computer")
+                return e
+            self._push_hint(e, s)
 
         return None
 
@@ -753,6 +1167,12 @@ class GalaxiesUI(tk.Tk):
         tk.Button(self, text="Solve", command=self.on_solve, bg="orange", fg="black").grid(row=2, column=6, padx=5, pady=8, sticky="we")
         tk.Button(self, text="Quit", command=self.destroy).grid(row=2, column=7, padx=5, pady=8, sticky="we")
 
+        # (puzzle, rev) the board layer was last drawn for, and (puzzle, cell) of the static layer
+        self._board_key = None
+        self._drawn_board = None
+        # Idle-coalesced redraw flag and the pending auto computer move, if any
+        self._redraw_pending = False
+        self._auto_move_id = None
         self.redraw()
 
     def show_difficulty_menu(self):
@@ -792,6 +1212,7 @@ class GalaxiesUI(tk.Tk):
             self.game = GalaxiesGame(n=self.grid_size)
             self.cell = 40 if self.grid_size >= 15 else (50 if self.grid_size >= 10 else 60)
             self.dot_r = 7 if self.grid_size >= 15 else 9
+            self._cancel_auto_move()
             self.redraw()
 
     def gx(self, x):
@@ -801,111 +1222,200 @@ class GalaxiesUI(tk.Tk):
         return self.margin + y * self.cell
 
     def redraw(self):
+        """Redraw the board if the walls or puzzle changed since the last draw, else just the arrows."""
+        self._redraw_pending = False
+        key = (self.game.puzzle, self.game.rev)
+        if key != self._board_key:
+            self._board_key = key
+            self.redraw_board()
+        else:
+            self.redraw_overlay()
+
+    def _request_redraw(self):
+        """Schedule a redraw for the next idle cycle; repeated requests coalesce into one."""
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after_idle(self._flush_redraw)
+
+    def _flush_redraw(self):
+        """Run a pending redraw now (no-op if a redraw already happened since the request)."""
+        if self._redraw_pending:
+            self.redraw()
+
+    def _draw_static(self):
+        """Clear the canvas and draw what only changes with the puzzle or cell size: grid, dots, border."""
         self.canvas.delete("all")
+        self._drawn_board = (self.game.puzzle, self.cell)
+        # canvas ids of the items redraw_board()/redraw_overlay() keep in step with the game
+        self._fill_ids = {}   # cell_id -> valid-region highlight
+        self._wall_ids = {}   # edge -> wall line
+        self._arrow_ids = {}  # (cell_x, cell_y) -> (Arrow drawn, line id or None)
         n = self.game.N
-
-        # Highlight valid regions (light blue)
-        valid_cells = self.game.get_valid_regions()
-        for cell_id in valid_cells:
-            x, y = cell_id % n, cell_id // n
-            x0, y0 = self.gx(x), self.gy(y)
-            x1, y1 = self.gx(x + 1), self.gy(y + 1)
-            self.canvas.create_rectangle(x0, y0, x1, y1, fill="#b0e0ff", outline="", tags="valid_region")
+        # Grid-line pixel offsets (gx(i) == gy(i) on the square board), looked up
+        # instead of calling gx/gy per item
+        self.xs = xs = [self.gx(i) for i in range(n + 1)]
+        self.mids = [x + self.cell / 2 for x in xs[:-1]]  # cell centres, gx(i + 0.5)
+        # edge_from_click bounds, relative to the board origin, and snap radius
+        self.board_px = n * self.cell
+        self.click_lo = -0.2 * self.cell  # clicks up to 0.2 cell outside the board still count
+        self.click_hi = self.board_px - self.click_lo
+        self.snap_px = self.snap_tol * self.cell
 
         # grid
         for i in range(n + 1):
-            x = self.gx(i)
-            self.canvas.create_line(x, self.gy(0), x, self.gy(n), width=self.grid_w, fill="#9a9a9a")
-            y = self.gy(i)
-            self.canvas.create_line(self.gx(0), y, self.gx(n), y, width=self.grid_w, fill="#9a9a9a")
+            self.canvas.create_line(xs[i], xs[0], xs[i], xs[n], width=self.grid_w, fill="#9a9a9a")
+            self.canvas.create_line(xs[0], xs[i], xs[n], xs[i], width=self.grid_w, fill="#9a9a9a")
 
-        # dots
+        # dots (pixel centres and half-cell lattice index kept for right-click snapping)
+        self.dot_at_half = {}
+        self.dot_px = []
+        self.snap_px_sq = self.snap_px ** 2
         for dot_idx, (dx, dy) in enumerate(self.game.puzzle.dots):
+            self.dot_at_half[(int(2 * dx), int(2 * dy))] = dot_idx
             cx = self.gx(dx); cy = self.gy(dy)
+            self.dot_px.append((cx, cy))
             self.canvas.create_oval(cx - self.dot_r, cy - self.dot_r, cx + self.dot_r, cy + self.dot_r,
                                     outline="black", width=2, fill="white", tags=f"dot_{dot_idx}")
 
-        # arrows (pointing to dots)
-        for arrow_idx, arrow in enumerate(self.game.arrows):
-            cell_cx = self.gx(arrow.cell_x + 0.5)
-            cell_cy = self.gy(arrow.cell_y + 0.5)
-            dot_x, dot_y = self.game.puzzle.dots[arrow.dot_idx]
-            dot_cx = self.gx(dot_x)
-            dot_cy = self.gy(dot_y)
+        # bold border
+        self.canvas.create_rectangle(xs[0], xs[0], xs[n], xs[n],
+                                     outline="black", width=8, tags="border")
 
-            # Draw arrow from cell to dot
-            dx = dot_cx - cell_cx
-            dy = dot_cy - cell_cy
-            dist = (dx**2 + dy**2) ** 0.5
-            if dist > 0:
-                dx /= dist
-                dy /= dist
-                end_x = cell_cx + dx * self.arrow_len
-                end_y = cell_cy + dy * self.arrow_len
-                self.canvas.create_line(cell_cx, cell_cy, end_x, end_y, width=2, fill="green", arrow="last", tags=f"arrow_{arrow_idx}")
+    def redraw_board(self):
+        """
+        Bring highlights, walls, status and arrows up to date.  Only items whose
+        state changed are created or deleted; the static layer is redrawn just
+        for a new puzzle or cell size.
+        """
+        if self._drawn_board != (self.game.puzzle, self.cell):
+            self._draw_static()
+        n = self.game.N
+        xs = self.xs
+
+        # Highlight valid regions (light blue), kept below the grid lines
+        valid_cells = self.game.get_valid_regions()
+        fills = self._fill_ids
+        for cell_id in [c for c in fills if c not in valid_cells]:
+            self.canvas.delete(fills.pop(cell_id))
+        for cell_id in valid_cells:
+            if cell_id not in fills:
+                y, x = divmod(cell_id, n)
+                fills[cell_id] = self.canvas.create_rectangle(xs[x], xs[y], xs[x + 1], xs[y + 1], fill="#b0e0ff",
+                                                              outline="", tags="valid_region")
+                self.canvas.tag_lower(fills[cell_id])
 
         # walls
-        for (t, x, y) in sorted(self.game.edges):
+        walls = self._wall_ids
+        edges = self.game.edges
+        for edge in [e for e in walls if e not in edges]:
+            self.canvas.delete(walls.pop(edge))
+        for edge in edges:
+            if edge in walls:
+                continue
+            t, x, y = edge
             if t == 'h':
-                x0, y0 = self.gx(x), self.gy(y)
-                x1, y1 = self.gx(x + 1), self.gy(y)
+                walls[edge] = self.canvas.create_line(xs[x], xs[y], xs[x + 1], xs[y], width=self.wall_w, fill="black", capstyle=tk.ROUND)
             else:
-                x0, y0 = self.gx(x), self.gy(y)
-                x1, y1 = self.gx(x), self.gy(y + 1)
-            self.canvas.create_line(x0, y0, x1, y1, width=self.wall_w, fill="black", capstyle=tk.ROUND)
-
-        # bold border
-        self.canvas.create_rectangle(self.gx(0), self.gy(0), self.gx(n), self.gy(n),
-                                     outline="black", width=8)
+                walls[edge] = self.canvas.create_line(xs[x], xs[y], xs[x], xs[y + 1], width=self.wall_w, fill="black", capstyle=tk.ROUND)
+        self.canvas.tag_raise("border")
 
         # status
-        adj = self.game.cell_adj_graph()
-        comps = bfs_components(adj, n * n)
-        valid_count = len(self.game.get_valid_regions())
+        region_count = self.game.region_count()
+        valid_count = len(valid_cells)
 
-        msg = f"Lines placed: {len(self.game.edges - self.game.fixed)} | Regions: {len(comps)} | Valid regions: {valid_count}/{len(self.game.puzzle.rects)}"
+        msg = f"Lines placed: {len(self.game.edges - self.game.fixed)} | Regions: {region_count} | Valid regions: {valid_count}/{len(self.game.puzzle.rects)}"
         if valid_count == len(self.game.puzzle.rects):
             msg += " | â All regions valid!"
         self.status.set(msg)
 
-    def edge_from_click(self, px, py):
-        n = self.game.N
-        gx = (px - self.margin) / self.cell
-        gy = (py - self.margin) / self.cell
-        if gx < -0.2 or gy < -0.2 or gx > n + 0.2 or gy > n + 0.2:
-            return None
+        self.redraw_overlay()
+
+    def redraw_overlay(self):
+        """Bring the arrows up to date; walls, highlights and status are left as drawn."""
+        if self._drawn_board != (self.game.puzzle, self.cell):
+            self._draw_static()
+        arrows = self.game.arrows_by_cell
+        drawn = self._arrow_ids
+        for cell in [c for c in drawn if c not in arrows]:
+            item = drawn.pop(cell)[1]
+            if item is not None:
+                self.canvas.delete(item)
+        # arrows (pointing to dots)
+        for cell, arrow in arrows.items():
+            old = drawn.get(cell)
+            if old is not None and old[0] == arrow:
+                continue
+            item = old[1] if old is not None else None
+            cell_cx = self.mids[arrow.cell_x]
+            cell_cy = self.mids[arrow.cell_y]
+            dot_cx, dot_cy = self.dot_px[arrow.dot_idx]
 
-        rx, ry = round(gx), round(gy)
-        dx, dy = abs(gx - rx), abs(gy - ry)
-        if min(dx, dy) > self.snap_tol:
+            # Draw arrow from cell to dot
+            dx = dot_cx - cell_cx
+            dy = dot_cy - cell_cy
+            dist = (dx**2 + dy**2) ** 0.5
+            if dist > 0:
+                dx /= dist
+                dy /= dist
+                end_x = cell_cx + dx * self.arrow_len
+                end_y = cell_cy + dy * self.arrow_len
+                if item is not None:
+                    # Arrow re-pointed: move the existing line instead of re-creating it
+                    self.canvas.coords(item, cell_cx, cell_cy, end_x, end_y)
+                else:
+                    item = self.canvas.create_line(cell_cx, cell_cy, end_x, end_y, width=2, fill="green", arrow="last",
+                                                   tags=("arrow", f"arrow_{cell[0]}_{cell[1]}"))
+            elif item is not None:
+                self.canvas.delete(item)  # now points at its own cell centre: nothing to draw
+                item = None
+            drawn[cell] = (arrow, item)
+
+    def edge_from_click(self, px, py):
+        cell = self.cell
+        ox, oy = px - self.margin, py - self.margin
+        lo, hi = self.click_lo, self.click_hi
+        if not (lo <= ox <= hi and lo <= oy <= hi):
             return None
 
+        # Work in pixels: one divmod per axis gives the cell index and the offset
+        # inside it; the nearer grid line picks the orientation and must be in
+        # snap range.  Only the along-line index needs a bound check.
+        cx, ox_in = divmod(ox, cell)
+        cy, oy_in = divmod(oy, cell)
+        dx, rx = (ox_in, cx) if 2 * ox_in <= cell else (cell - ox_in, cx + 1)
+        dy, ry = (oy_in, cy) if 2 * oy_in <= cell else (cell - oy_in, cy + 1)
         if dx < dy:
-            x = int(rx)
-            y = int(gy)
-            if 0 <= x <= n and 0 <= y < n:
-                return ('v', x, y)
-        else:
-            x = int(gx)
-            y = int(ry)
-            if 0 <= x < n and 0 <= y <= n:
-                return ('h', x, y)
+            if dx <= self.snap_px and oy < self.board_px:
+                return ('v', rx, max(cy, 0))
+        elif dy <= self.snap_px and ox < self.board_px:
+            return ('h', max(cx, 0), ry)
         return None
 
     def on_click(self, event):
+        if self._drawn_board != (self.game.puzzle, self.cell):
+            self._flush_redraw()  # click geometry is rebuilt with the static layer
         edge = self.edge_from_click(event.x, event.y)
         if edge is None:
             return
 
         self.game.toggle_edge(edge, who="player")
-        self.redraw()
+        self._request_redraw()
 
         # AUTO COMPUTER MOVE: After player moves, computer automatically makes a greedy move
+        # (a newer click replaces the pending move instead of queueing a second one)
+        self._cancel_auto_move()
         if not self.game.is_solved():
-            self.after(500, self.auto_computer_move)
+            self._auto_move_id = self.after(500, self.auto_computer_move)
+
+    def _cancel_auto_move(self):
+        """Drop the scheduled auto computer move, if any."""
+        if self._auto_move_id is not None:
+            self.after_cancel(self._auto_move_id)
+            self._auto_move_id = None
 
     def auto_computer_move(self):
         """Computer automatically makes a greedy move after player's move."""
+        self._auto_move_id = None
         if self.game.is_solved():
             messagebox.showinfo("Galaxies", "Puzzle solved! Congratulations!")
             return
@@ -918,6 +1428,8 @@ class GalaxiesUI(tk.Tk):
 
     def on_right_click(self, event):
         """Right-click on a dot to place an arrow from clicked cell to that dot."""
+        if self._drawn_board != (self.game.puzzle, self.cell):
+            self._flush_redraw()  # dot lookup is rebuilt with the static layer
         n = self.game.N
         px, py = event.x, event.y
 
@@ -925,19 +1437,14 @@ class GalaxiesUI(tk.Tk):
         gx = (px - self.margin) / self.cell
         gy = (py - self.margin) / self.cell
 
-        # Find nearest dot within snap tolerance
-        nearest_dot = None
-        nearest_dist = self.snap_tol * self.cell
-        for dot_idx, (dx, dy) in enumerate(self.game.puzzle.dots):
-            cx = self.gx(dx)
-            cy = self.gy(dy)
-            dist = ((px - cx)**2 + (py - cy)**2) ** 0.5
-            if dist < nearest_dist:
-                nearest_dist = dist
-                nearest_dot = dot_idx
-
+        # Find nearest dot within snap tolerance: the radius is under a quarter
+        # cell, so only a dot on the nearest half-cell lattice point can qualify
+        nearest_dot = self.dot_at_half.get((round(2 * gx), round(2 * gy)))
         if nearest_dot is None:
             return
+        cx, cy = self.dot_px[nearest_dot]
+        if (px - cx)**2 + (py - cy)**2 >= self.snap_px_sq:
+            return
 
         # Find which cell we're in (or closest to)
         cell_x = int(round(gx))
@@ -945,17 +1452,9 @@ class GalaxiesUI(tk.Tk):
         if not (0 <= cell_x < n and 0 <= cell_y < n):
             return
 
-        # Check if this arrow already exists
-        for i, arrow in enumerate(self.game.arrows):
-            if arrow.cell_x == cell_x and arrow.cell_y == cell_y:
-                # Move existing arrow to new dot
-                self.game.arrows[i] = Arrow(cell_x, cell_y, nearest_dot)
-                self.redraw()
-                return
-
-        # Create new arrow
-        self.game.arrows.append(Arrow(cell_x, cell_y, nearest_dot))
-        self.redraw()
+        # Create the arrow, or move an existing one in this cell to the new dot
+        self.game.arrows_by_cell[(cell_x, cell_y)] = Arrow(cell_x, cell_y, nearest_dot)
+        self._request_redraw()
 
     def on_arrow_drag(self, event):
         """Drag an arrow (currently not used, but could enable arrow repositioning)."""
@@ -973,8 +1472,8 @@ class GalaxiesUI(tk.Tk):
             # Remove arrow near nearest cell to release point
             cell_x = int(round(gx))
             cell_y = int(round(gy))
-            self.game.arrows = [a for a in self.game.arrows if not (a.cell_x == cell_x and a.cell_y == cell_y)]
-            self.redraw()
+            if self.game.arrows_by_cell.pop((cell_x, cell_y), None) is not None:
+                self._request_redraw()
 
     def do_computer_turn(self):
         if not self.game.is_solved():
@@ -985,15 +1484,18 @@ class GalaxiesUI(tk.Tk):
 
     # Buttons
     def on_new_game(self):
+        self._cancel_auto_move()
         self.game.new_puzzle()
-        self.redraw()
+        self._request_redraw()
 
     def on_restart(self):
+        self._cancel_auto_move()
         self.game.reset()
-        self.redraw()
+        self._request_redraw()
 
     def on_solve(self):
-        self.game.edges = set(self.game.fixed) | set(self.game.solution)
+        self._cancel_auto_move()
+        self.game.solve()
         self.redraw()
         messagebox.showinfo("Galaxies", "Solution drawn (for reference).")
 
@@ -1007,11 +1509,11 @@ class GalaxiesUI(tk.Tk):
 
     def on_undo(self):
         if self.game.undo():
-            self.redraw()
+            self._request_redraw()
 
     def on_redo(self):
         if self.game.redo():
-            self.redraw()
+            self._request_redraw()
 
 
 if __name__ == "__main__":
@@ -1,14 +1,17 @@
 #!/usr/bin/env python3
 """Quick test of core Galaxies game logic without GUI."""
 
+import os
+import random
 import sys
-sys.path.insert(0, '/home/bharath/Documents/DAA')
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from Galaxies import (
-    GalaxiesPuzzle, GalaxiesGame, 
-    has_rotational_symmetry, get_region_cells, 
+    GalaxiesPuzzle, GalaxiesGame,
+    has_rotational_symmetry,
     count_dots_in_region, is_region_valid
 )
+import Galaxies_backup
 
 print("=" * 60)
 print("Testing Galaxies Puzzle Logic")
@@ -18,7 +21,7 @@ print("=" * 60)
 print("\n[Test 1] Puzzle Generation")
 puzzle = GalaxiesPuzzle(n=5)
 puzzle.generate()
-print(f"✓ Generated {len(puzzle.regions)} polyomino regions on 5x5 grid")
+print(f"✓ Generated {len(puzzle.rects)} polyomino regions on 5x5 grid")
 print(f"✓ Placed {len(puzzle.dots)} dots (one per region)")
 print(f"✓ Solution has {len(puzzle.solution_edges)} edges")
 
@@ -59,7 +62,166 @@ print(f"✓ After undo: {len(game.edges)}")
 game.redo()
 print(f"✓ After redo: {len(game.edges)}")
 
+
+
+# Reference implementations: recompute everything from scratch with plain
+# BFS over (x, y) cells and the edge set, to check the incremental versions.
+
+def reference_regions(n, edges):
+    """Regions of the board as sets of (x, y) cells."""
+    seen = set()
+    regions = []
+    for sy in range(n):
+        for sx in range(n):
+            if (sx, sy) in seen:
+                continue
+            region = {(sx, sy)}
+            queue = [(sx, sy)]
+            seen.add((sx, sy))
+            while queue:
+                x, y = queue.pop()
+                for nx, ny, wall in ((x + 1, y, ('v', x + 1, y)), (x - 1, y, ('v', x, y)),
+                                     (x, y + 1, ('h', x, y + 1)), (x, y - 1, ('h', x, y))):
+                    if 0 <= nx < n and 0 <= ny < n and wall not in edges and (nx, ny) not in seen:
+                        seen.add((nx, ny))
+                        region.add((nx, ny))
+                        queue.append((nx, ny))
+            regions.append(region)
+    return regions
+
+
+def reference_region_valid(region, dots):
+    """Exactly one dot, and the region maps onto itself rotated 180° about it."""
+    inside = [(dx, dy) for dx, dy in dots if (int(dx), int(dy)) in region]
+    if len(inside) != 1:
+        return False
+    dx, dy = inside[0]
+    return all((2 * dx - x - 1, 2 * dy - y - 1) in region for x, y in region)
+
+
+def reference_valid_cells(n, edges, dots):
+    return {y * n + x for region in reference_regions(n, edges)
+            if reference_region_valid(region, dots) for x, y in region}
+
+
+def reference_greedy_score(game, edge):
+    """The original hint score: +10 if the edge splits a region, +5 if valid cells grow."""
+    n, dots = game.N, game.puzzle.dots
+    regions_before = len(reference_regions(n, game.edges))
+    valid_before = len(reference_valid_cells(n, game.edges, dots))
+    with_edge = game.edges | {edge}
+    score = 0
+    if len(reference_regions(n, with_edge)) > regions_before:
+        score += 10
+    if len(reference_valid_cells(n, with_edge, dots)) > valid_before:
+        score += 5
+    return score
+
+
+def checked_hint(game):
+    """Take one hint and check it is a highest-scoring missing edge (None once solved)."""
+    scores = {edge: reference_greedy_score(game, edge) for edge in game.solution - game.edges}
+    edge = game.computer_move()
+    if not scores:
+        assert edge is None
+    else:
+        assert edge in scores and scores[edge] == max(scores.values()), (edge, scores)
+    return edge
+
+
+def interior_edges(n):
+    return ([('h', x, y) for x in range(n) for y in range(1, n)] +
+            [('v', x, y) for x in range(1, n) for y in range(n)])
+
+
+def random_moves(game, rng, steps):
+    """Drive a game through random toggle/undo/redo/hint/solve/reset moves."""
+    solution = sorted(game.solution)
+    interior = interior_edges(game.N)
+    for _ in range(steps):
+        r = rng.random()
+        if r < 0.5:
+            edge = rng.choice(solution) if rng.random() < 0.6 else rng.choice(interior)
+            game.toggle_edge(edge, who="player")
+        elif r < 0.62:
+            game.undo()
+        elif r < 0.7:
+            game.redo()
+        elif r < 0.95:
+            checked_hint(game)
+        elif r < 0.98:
+            game.solve()
+        else:
+            game.reset()
+        yield
+
+
+def check_board(game):
+    """Compare a game's incrementally maintained state with a from-scratch recomputation."""
+    n, dots = game.N, game.puzzle.dots
+    regions = reference_regions(n, game.edges)
+    assert game.region_count() == len(regions)
+    assert game.get_valid_regions() == reference_valid_cells(n, game.edges, dots)
+    assert game.is_solved() == ((game.edges - game.fixed) == game.solution)
+    for region in regions:
+        comp = [y * n + x for x, y in region]
+        assert game.is_component_valid(comp) == reference_region_valid(region, dots)
+
+
+# Test 7: Incremental region tracking (Galaxies.py)
+print("\n[Test 7] Incremental Regions vs. Recomputation")
+for seed in range(6):
+    game = GalaxiesGame(n=(5, 7, 10)[seed % 3], seed=seed)
+    rng = random.Random(seed)
+    for _ in random_moves(game, rng, 120):
+        check_board(game)
+        assert game.user_edge_count == len(game.edges - game.fixed)
+    for edge in sorted(game.solution - game.edges)[:10]:
+        assert game.greedy_score(edge) == reference_greedy_score(game, edge), edge
+print("✓ Regions, validity, solved state and hint scores match a full recount")
+
+# Test 8: Hints alone solve the puzzle (lazy greedy heap)
+print("\n[Test 8] Greedy Hints Solve the Puzzle")
+for game_class in (GalaxiesGame, Galaxies_backup.GalaxiesGame):
+    for seed in range(4):
+        game = game_class(n=7, seed=seed)
+        moves = 0
+        while checked_hint(game) is not None:
+            moves += 1
+        assert game.is_solved() and moves == len(game.solution)
+print("✓ Every hint drew a highest-scoring missing edge until solved")
+
+# Test 9: Incremental union-find (Galaxies_backup.py)
+print("\n[Test 9] Backup Game Union-Find vs. Recomputation")
+for seed in range(6):
+    game = Galaxies_backup.GalaxiesGame(n=(5, 7, 10)[seed % 3], seed=seed)
+    rng = random.Random(seed)
+    for _ in random_moves(game, rng, 120):
+        check_board(game)
+print("✓ Backup regions, validity and solved state match a full recount")
+
+# Test 10: Bridge-based edge scores (Galaxies_backup.py)
+print("\n[Test 10] Model Edge Scores vs. Trial Edges")
+for seed in range(6):
+    n = (5, 7, 10)[seed % 3]
+    model = Galaxies_backup.GalaxiesModel(n, seed=seed)
+    model.new_puzzle()
+    rng = random.Random(seed)
+    interior = interior_edges(n)
+    model.edges = set(rng.sample(interior, rng.randint(0, len(interior) // 2)))
+    expected = {}
+    for edge in interior:
+        if edge in model.edges:
+            continue
+        regions = reference_regions(n, model.edges | {edge})
+        score = sum(len(region) * 0.5 for region in regions if len(region) < n)
+        score += 10 * sum(1 for region in regions
+                          if count_dots_in_region(region, model.puzzle.dots) == 1)
+        expected[edge] = score
+    assert model.compute_edge_scores() == expected
+print("✓ Bridge scoring matches adding each edge and recounting")
+
 print("\n" + "=" * 60)
 print("All tests passed! ✓")
 print("=" * 60)
-print("\nYou can now run: python /home/bharath/Documents/DAA/Galaxies.py")
+print("\nYou can now run: python Galaxies.py")